@@ -0,0 +1,8 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+
+"""
+Benchmarks of performance critical components (not executed by tests).
+"""
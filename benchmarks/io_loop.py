@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Compares I/O backends: wake-up latency (element put into the send queue from
+another thread until datagram is received) and CPU time used per event.
+
+Usage: python -m benchmarks.io_loop [--rounds N]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import threading
+import time
+from typing import IO
+
+from emtorch.config import Config
+from emtorch.io import IOLoop
+from emtorch.io.net import NetworkAddress
+from emtorch.io.sockets import UdpClientSocket
+from emtorch.io.streams import InputStream
+
+
+class _Counter(InputStream):
+    def __init__(self, stream: IO[bytes], expected: int):
+        super().__init__("counter", stream)
+        self.remaining = expected
+        self.done = threading.Event()
+
+    def read(self) -> None:
+        data = os.read(self.fileno(), 64 * 1024)
+        if not data:
+            self.mark_eof()
+        self.remaining -= len(data)
+        if self.remaining <= 0:
+            self.done.set()
+
+
+def _wakeup_latency(io: IOLoop, rounds: int) -> list[float]:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+        server.bind(("127.0.0.1", 0))
+        target = NetworkAddress(*server.getsockname())
+        queue = io.make_queue(tuple[NetworkAddress, bytes | memoryview])
+        udp = UdpClientSocket("udp", queue)
+        io.register(udp)
+        result = []
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            queue.put((target, b"x"))
+            server.recv(16)
+            result.append(time.perf_counter() - t0)
+        io.close(udp, block=True)
+    return result
+
+
+def _cpu_per_event(io: IOLoop, rounds: int) -> float:
+    r, w = os.pipe()
+    with os.fdopen(r, "rb") as stream:
+        counter = _Counter(stream, rounds)
+        io.register(counter)
+        cpu = time.process_time()
+        for _ in range(rounds):
+            os.write(w, b"x")  # each write wakes the loop (unless already awake)
+        counter.done.wait()
+        cpu = time.process_time() - cpu
+        os.close(w)
+        io.close(stream, block=True)
+    return cpu / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5000)
+    args = parser.parse_args()
+
+    for backend in ("selector", "asyncio"):
+        io = IOLoop.from_config(Config({"io": {"backend": backend}}))
+        io.start()
+        try:
+            latency = sorted(_wakeup_latency(io, args.rounds))
+            cpu = _cpu_per_event(io, args.rounds)
+        finally:
+            io.stop()
+        print(
+            f"{backend:>8}: wake-up latency median {statistics.median(latency) * 1e6:.1f}us"
+            f", p99 {latency[int(len(latency) * 0.99)] * 1e6:.1f}us"
+            f", CPU per event {cpu * 1e6:.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
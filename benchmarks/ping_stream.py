@@ -0,0 +1,114 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Compares I/O thread load of parsing flood ping output by `PingIsAliveStream`
+with the previous byte-by-byte implementation. Output of `ping -f` to the
+unreachable target (header and `.` written separately for each request)
+is generated by a fake ping process.
+
+Usage: python -m benchmarks.ping_stream [--pings N]
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import time
+from typing import IO, Callable
+
+from emtorch.io import IOLoop
+from emtorch.io.streams import InputStream
+from emtorch.subtasks.ping import PingIsAliveStream
+
+_FAKE_PING = """
+import os, sys
+os.write(1, b"PING 192.0.2.1 (192.0.2.1) 56(84) bytes of data.\\n")
+for _ in range(int(sys.argv[1])):
+    os.write(1, b".")
+"""
+
+
+class _ByteLoopStream(InputStream):
+    """
+    `PingIsAliveStream` before bulk parsing (reading with `os.read`, as buffered
+    `read(1)` could leave data unnoticed by select).
+    """
+
+    def __init__(self, name: str, stream: IO[bytes], process: subprocess.Popen[bytes]):
+        super().__init__(name, stream)
+        self.header = b""
+        self.header_done = False
+        self.response_received = False
+        self.process = process
+
+    def read(self) -> None:
+        char = os.read(self.fileno(), 1)
+        if len(char) == 0:
+            self.mark_eof()
+            return
+        self.transferred += 1
+        if self.header_done:
+            match char:
+                case b"\b":
+                    if not self.response_received:
+                        self.logger.info("Response received")
+                    self.response_received = True
+                case b".":
+                    if self.response_received:
+                        self.logger.info("Ping received")
+                        self.process.terminate()
+                    else:
+                        self.logger.info("Ping")
+                case b"E":
+                    self.logger.warning("Error response")
+                    self.response_received = False
+        else:
+            if char == b"\n":
+                self.logger.info(f"{self.header!r}")
+                self.header_done = True
+            else:
+                self.header += char
+
+
+def _measure(
+    make: Callable[[str, IO[bytes], subprocess.Popen[bytes]], InputStream],
+    pings: int,
+) -> tuple[int, float, float]:
+    io = IOLoop(stats_interval=0)
+    io.start()
+    try:
+        t0 = time.perf_counter()
+        with subprocess.Popen(
+            [sys.executable, "-c", _FAKE_PING, str(pings)], stdout=subprocess.PIPE
+        ) as process:
+            assert process.stdout is not None
+            stream = make("bench", process.stdout, process)
+            io.register(stream)
+            process.wait()
+            while not stream.at_eof():
+                time.sleep(0.01)
+        elapsed = time.perf_counter() - t0
+    finally:
+        io.stop()
+    return io.stats.events, io.stats.busy, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pings", type=int, default=100_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+    for name, make in (("byte loop", _ByteLoopStream), ("bulk", PingIsAliveStream)):
+        events, busy, elapsed = _measure(make, args.pings)
+        print(
+            f"{name:>9}: {events} events, I/O thread busy {busy:.3f}s"
+            f" ({busy / args.pings * 1e6:.2f}us per ping), total {elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
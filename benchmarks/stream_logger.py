@@ -0,0 +1,88 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Compares line splitting of `StreamLogger` with the previous byte-by-byte
+implementation (lines per second and MB/s of subprocess output handled).
+
+Usage: python -m benchmarks.stream_logger [--lines N] [--line-size B]
+"""
+
+import argparse
+import logging
+import os
+import threading
+import time
+from typing import IO, Callable
+
+from emtorch.io.streams import InputStream, StreamLogger
+
+
+class _ByteLoopLogger(InputStream):
+    """
+    `StreamLogger` before bulk line splitting.
+    """
+
+    def __init__(self, name: str, subname: str, stream: IO[bytes]):
+        super().__init__(name, stream)
+        self._subname = subname
+        self._buffer = bytearray()
+
+    def read(self) -> None:
+        data = self.stream.read(4 * 1024)
+        if len(data) == 0:
+            self.mark_eof()
+        for b in data:
+            if b == b"\n"[0]:
+                self.logger.info(f"{self._subname} - {bytes(self._buffer.rstrip())!r}")
+                self._buffer.clear()
+            else:
+                self._buffer.append(b)
+
+
+def _feed(w: int, lines: int, line_size: int) -> None:
+    line = b"x" * (line_size - 1) + b"\n"
+    chunk = line * max(1, 64 * 1024 // line_size)
+    remaining = lines
+    with os.fdopen(w, "wb") as stream:
+        while remaining > 0:
+            count = min(remaining, len(chunk) // line_size)
+            stream.write(chunk[: count * line_size])
+            remaining -= count
+
+
+def _measure(
+    make: Callable[[str, str, IO[bytes]], InputStream], lines: int, line_size: int
+) -> float:
+    r, w = os.pipe()
+    writer = threading.Thread(target=_feed, args=(w, lines, line_size))
+    with os.fdopen(r, "rb") as stream:
+        reader = make("bench", "STDOUT", stream)
+        writer.start()
+        t0 = time.perf_counter()
+        while not reader.at_eof():
+            reader.read()
+        elapsed = time.perf_counter() - t0
+    writer.join()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--line-size", type=int, default=80)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+    size = args.lines * args.line_size / 1e6
+    for name, make in (("byte loop", _ByteLoopLogger), ("bulk", StreamLogger)):
+        elapsed = _measure(make, args.lines, args.line_size)
+        print(
+            f"{name:>9}: {args.lines / elapsed:,.0f} lines/s"
+            f", {size / elapsed:.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
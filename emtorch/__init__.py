@@ -8,26 +8,50 @@ Main module of the application.
 
 import json
 import logging
+from pathlib import Path
 
 from .arguments import Arguments
-from .case import Case
+from .case.cache import PayloadCache
+from .case.dedupe import Deduplicator
 from .case.instance import CaseInstance
+from .case.mutation import MutationEngine
+from .case.pool import TargetPool
+from .case.prefetch import Prefetcher
 from .config import Config
 from .context import Context
 from .results import Results
+from .results.journal import Journal
 
 logger = logging.getLogger(__name__)
 
 
 def execute(args: Arguments, config: Config) -> Results:
+    journal_path = Path(args.output_prefix + ".journal")
     with Context(config) as context:
-        case = Case.from_config(context)
-
-        for instance in CaseInstance.list_from(args):
-            with context.enter_case(instance) as case_context:
-                case.execute(case_context)
-            case.wait_between_cases()
-
+        pool = TargetPool.from_config(context)
+        cache = PayloadCache(args.cache_size, args.mmap_threshold)
+        if args.mutations > 0:
+            engine = MutationEngine.from_args(args)
+            instances = CaseInstance.repeated(args, engine.generate)
+        else:
+            instances = CaseInstance.stream_from(args, cache)
+        if args.dedupe:
+            instances = Deduplicator(context.results).wrap(instances)
+        if args.resume:
+            finished = set()
+            for record in Journal.read(journal_path):
+                context.results.restore_case(record)
+                finished.add(record["id"])
+            context.results.info["resumed"] = len(finished)
+            logger.info(f"Resuming, {len(finished)} cases already finished")
+            instances = (i for i in instances if i.identifier.unique not in finished)
+        with (
+            Journal(journal_path) as journal,
+            Prefetcher(args.prefetch_depth, args.prefetch_size) as prefetcher,
+        ):
+            context.results.add_case_listener(journal.append)
+            pool.execute(prefetcher.wrap(instances))
+        context.results.info["payloads"] = cache.stats
         return context.results
 
 
@@ -14,14 +14,16 @@ from pathlib import Path
 
 from . import run
 from .arguments import Arguments, RepeatMode
+from .case.source import STDIN, is_explicit_file
 from .config import Config
 from .version import VERSION
 
 
 def __parse_data(parser: argparse.ArgumentParser, data: list[str]) -> list[Path]:
+    # only explicitly specified files are checked, other inputs are expanded lazily
     result = [Path(f) for f in data]
     for f in result:
-        if not f.is_file():
+        if is_explicit_file(f) and not f.is_file():
             parser.error(f"Specified path is not a file: {f}")
     if len(result) != len(set(result)):
         parser.error("Non-unique file names as inputs - results would be inconsistent")
@@ -55,7 +57,8 @@ def parse_args() -> Arguments:
     parser.add_argument(
         "data",
         nargs="+",
-        help="list of files containing binary data to send to the target",
+        help="files containing binary data to send to the target; directories, "
+        "glob patterns, @files listing paths or - (paths from stdin) are accepted",
     )
     parser.add_argument(
         "--output-prefix",
@@ -82,6 +85,64 @@ def parse_args() -> Arguments:
         default="aabb",
         type=str,
     )
+    parser.add_argument(
+        "--resume",
+        help="prefix of the interrupted run to be resumed (skips finished cases)",
+        metavar="PREFIX",
+        type=str,
+    )
+    parser.add_argument(
+        "--cache-size",
+        help="maximum size (in bytes) of data files contents kept in memory",
+        default=Arguments.cache_size,
+        type=int,
+    )
+    parser.add_argument(
+        "--mmap-threshold",
+        help="size (in bytes) from which data files are memory-mapped (not read)",
+        default=Arguments.mmap_threshold,
+        type=int,
+    )
+    parser.add_argument(
+        "--prefetch-depth",
+        help="number of following cases which data is read in advance (0 disables)",
+        default=Arguments.prefetch_depth,
+        type=int,
+    )
+    parser.add_argument(
+        "--prefetch-size",
+        help="maximum size (in bytes) of data read in advance and not used yet",
+        default=Arguments.prefetch_size,
+        type=int,
+    )
+    parser.add_argument(
+        "--mutations",
+        help="number of mutants generated from each data file (0 uses files as-is)",
+        default=Arguments.mutations,
+        type=int,
+    )
+    parser.add_argument(
+        "--mutators",
+        help="comma separated mutation strategies (bitflip, insert, splice, dictionary)",
+        default=",".join(Arguments.mutators),
+        type=str,
+    )
+    parser.add_argument(
+        "--dictionary",
+        help="file with tokens (one per line) used by 'dictionary' mutation strategy",
+        type=Path,
+    )
+    parser.add_argument(
+        "--mutation-seed",
+        help="seed of the random generator used for mutations",
+        default=Arguments.mutation_seed,
+        type=int,
+    )
+    parser.add_argument(
+        "--dedupe",
+        help="skip cases which data has the same contents as one of previous cases",
+        action="store_true",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -92,10 +153,24 @@ def parse_args() -> Arguments:
 
     if args.repeats < 1:
         parser.error("--repeats must be >= 1")
+    if args.prefetch_depth < 0:
+        parser.error("--prefetch-depth must be >= 0")
+    if args.mutations < 0:
+        parser.error("--mutations must be >= 0")
+    if args.dictionary is not None and not args.dictionary.is_file():
+        parser.error(f"Specified dictionary is not a file: {args.dictionary}")
 
     args.data = __parse_data(parser, args.data)
     args.repeat_mode = RepeatMode(args.repeat_mode)
-    args.output_prefix += f"-{datetime.now():%Y%m%d-%H%M%S}"
+    args.mutators = tuple(m.strip() for m in args.mutators.split(",") if m.strip())
+    if STDIN in args.data and args.repeats > 1 and args.repeat_mode == RepeatMode.ABAB:
+        parser.error("Paths from stdin can not be repeated in 'abab' mode")
+    if args.resume:
+        args.output_prefix = args.resume
+        args.resume = True
+    else:
+        args.output_prefix += f"-{datetime.now():%Y%m%d-%H%M%S}"
+        args.resume = False
 
     return Arguments(**vars(args))
 
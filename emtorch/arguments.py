@@ -17,9 +17,19 @@ class RepeatMode(Enum):
 
 
 @dataclass
-class Arguments:
+class Arguments:  # pylint: disable=too-many-instance-attributes
     data: list[Path]
     output_prefix: str
     config: Path
     repeats: int
     repeat_mode: RepeatMode
+    resume: bool = False
+    cache_size: int = 64 * 1024 * 1024
+    mmap_threshold: int | None = None
+    prefetch_depth: int = 0
+    prefetch_size: int = 16 * 1024 * 1024
+    mutations: int = 0
+    mutators: tuple[str, ...] = ("bitflip", "insert", "splice", "dictionary")
+    dictionary: Path | None = None
+    mutation_seed: int = 0
+    dedupe: bool = False
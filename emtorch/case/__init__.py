@@ -6,33 +6,54 @@
 Module representing "case" - a single instance of the experiment execution.
 """
 
-from typing import Self
+import logging
+import threading
+from typing import Self, cast
 
-from ..config import Config
 from ..context import CaseContext, Context
-from ..delay import Delay
+from ..delay import ConditionalDelay, Delay, delay_from_config
+from ..results.values import TypedValue
 from ..subtasks import SubTasks
 
+logger = logging.getLogger(__name__)
+
 
 class CaseDelays:
-    def __init__(self, between_cases: Delay, before_actions: Delay):
+    def __init__(
+        self,
+        between_cases: Delay,
+        before_actions: Delay,
+        values: dict[str, TypedValue[float]] | None = None,
+    ):
         self._between_cases = between_cases
         self._before_actions = before_actions
+        self._values = values or {}
 
-    def wait_before_actions(self) -> None:
-        self._before_actions.wait()
+    def wait_before_actions(self, context: CaseContext) -> None:
+        self._wait(self._before_actions, context)
 
-    def wait_between_cases(self) -> None:
-        self._between_cases.wait()
+    def wait_between_cases(self, context: CaseContext) -> None:
+        self._wait(self._between_cases, context)
+
+    def _wait(self, delay: Delay, context: CaseContext) -> None:
+        waited = delay.wait()
+        if (value := self._values.get(delay.name())) is not None:
+            value.collect(context.case.identifier, waited)
 
     @classmethod
-    def from_config(cls, *prefix: str, config: Config) -> Self:
-        return cls(
-            between_cases=Delay.from_config(*prefix, "between_cases", config=config),
-            before_actions=Delay.from_config(*prefix, "before_actions", config=config),
-        )
+    def from_config(cls, *prefix: str, context: Context) -> Self:
+        between_cases = delay_from_config(*prefix, "between_cases", context=context)
+        before_actions = delay_from_config(*prefix, "before_actions", context=context)
+        values: dict[str, TypedValue[float]] = {}
+        for delay in (between_cases, before_actions):
+            if isinstance(delay, ConditionalDelay):
+                # time actually waited is stored in results
+                value = context.register_value(delay.name(), TypedValue[float]())
+                values[delay.name()] = cast(TypedValue[float], value)
+        return cls(between_cases, before_actions, values)
 
 
+# pylint: disable=too-many-instance-attributes
 class Case:
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -43,29 +64,75 @@ class Case:
         monitoring: SubTasks,
         checks: SubTasks,
         actions: SubTasks,
+        host_checks: SubTasks | None = None,
     ):
         self._delays = delays
         self._setups = setups
         self._monitoring = monitoring
         self._checks = checks
         self._actions = actions
+        self._host_checks = host_checks
+
+        self._background: threading.Thread | None = None
+        self._background_error: BaseException | None = None
 
     def execute(self, context: CaseContext) -> None:
         self._setups.execute_for(context)
         with self._monitoring.monitor(context):
-            self._delays.wait_before_actions()
+            self._delays.wait_before_actions(context)
             self._actions.execute_for(context)
         self._checks.execute_for(context)
+        if self._host_checks:
+            self._start_host_checks(context)
+
+    def wait_between_cases(self, context: CaseContext) -> None:
+        self._delays.wait_between_cases(context)
+
+    def wait_for_host_checks(self) -> None:
+        """
+        Waits for host-only checks of the previous case (executed in the background).
+        """
+        if self._background is None:
+            return
+        self._background.join()
+        self._background = None
+        if self._background_error is not None:
+            error, self._background_error = self._background_error, None
+            raise error
+
+    def _start_host_checks(self, context: CaseContext) -> None:
+        assert self._host_checks is not None
+        host_checks = self._host_checks
+
+        # same sub-task instances are used for each case, only one execution at a time
+        self.wait_for_host_checks()
+
+        def execute() -> None:
+            try:
+                host_checks.execute_for(context)
+                context.release()
+            except BaseException as ex:  # pylint: disable=broad-exception-caught
+                logger.error(
+                    f"Host-only checks of {context.case.identifier} failed: {ex!r}"
+                )
+                self._background_error = ex
 
-    def wait_between_cases(self) -> None:
-        self._delays.wait_between_cases()
+        context.hold()
+        self._background = threading.Thread(name="host-checks", target=execute)
+        self._background.start()
 
     @classmethod
     def from_config(cls, context: Context) -> Self:
+        delays = CaseDelays.from_config("case", "delays", context=context)
+        setups = SubTasks.from_config("case", "setups", context=context)
+        checks, host_checks = SubTasks.from_config(
+            "case", "checks", context=context
+        ).partition()
         return cls(
-            delays=CaseDelays.from_config("case", "delays", config=context.config_root),
-            setups=SubTasks.from_config("case", "setups", context=context),
-            checks=SubTasks.from_config("case", "checks", context=context),
+            delays=delays,
+            setups=setups,
+            checks=checks,
             monitoring=SubTasks.from_config("case", "monitoring", context=context),
             actions=SubTasks.from_config("case", "actions", context=context),
+            host_checks=host_checks,
         )
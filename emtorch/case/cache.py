@@ -0,0 +1,156 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing cache of cases data (payloads) shared by all cases.
+"""
+
+import logging
+import mmap
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+type Payload = bytes | memoryview
+
+
+@dataclass
+class _Entry:
+    payload: Payload
+    size: int
+    pins: int = 0
+    mapping: mmap.mmap | None = None
+
+    def close(self) -> None:
+        if self.mapping is None:
+            return
+        assert isinstance(self.payload, memoryview)
+        self.payload.release()
+        try:
+            self.mapping.close()
+        except BufferError:  # still referenced somewhere, will be closed when freed
+            logger.debug("Mapped payload still in use")
+
+
+class PayloadCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Size-bounded LRU cache of payloads. Payloads of cases in progress are pinned
+    (never evicted), the least recently used unpinned ones are evicted when size
+    exceeds `max_size`. Files of at least `mmap_threshold` bytes are memory-mapped
+    and served as read-only `memoryview` instead of being read into memory.
+    """
+
+    def __init__(self, max_size: int, mmap_threshold: int | None = None):
+        self._max_size = max_size
+        self._mmap_threshold = mmap_threshold
+        self._entries: OrderedDict[Path, _Entry] = OrderedDict()
+        self._size = 0
+        self._loading: dict[Path, threading.Event] = {}
+        self._prefetched: dict[Path, int] = {}  # prefetched, but not used yet
+        self._lock = threading.Lock()  # cases can be executed on many targets
+        self.stats = {
+            "cache_hits": 0,
+            "prefetch_hits": 0,
+            "misses": 0,  # payload was not ready when needed
+            "prefetch_skipped": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def acquire(self, path: Path) -> Payload:
+        """
+        Returns (pinned) payload of given file, loading it if not cached.
+        """
+        missed = False
+        while True:
+            with self._lock:
+                if (entry := self._entries.get(path)) is not None:
+                    self._entries.move_to_end(path)
+                    entry.pins += 1
+                    if missed:
+                        self.stats["misses"] += 1
+                    elif self._prefetched.pop(path, None) is not None:
+                        self.stats["prefetch_hits"] += 1
+                    else:
+                        self.stats["cache_hits"] += 1
+                    self._prefetched.pop(path, None)  # used after waiting for it
+                    return entry.payload
+                if (loading := self._loading.get(path)) is None:
+                    self.stats["misses"] += 1
+                    self._loading[path] = threading.Event()
+                    break
+            loading.wait()  # being prefetched at the moment
+            missed = True
+
+        return self._insert(path, pins=1).payload
+
+    def prefetch(self, path: Path, max_size: int) -> None:
+        """
+        Loads payload in advance (not pinned), unless payloads already prefetched
+        and not used yet would exceed `max_size`.
+        """
+        with self._lock:
+            if path in self._entries or path in self._loading:
+                return
+            try:
+                size = path.stat().st_size
+            except OSError:
+                return  # reported when actually used
+            if sum(self._prefetched.values()) + size > max_size:
+                self.stats["prefetch_skipped"] += 1
+                return
+            self._loading[path] = threading.Event()
+
+        self._insert(path, pins=0)
+
+    def release(self, path: Path) -> None:
+        with self._lock:
+            entry = self._entries[path]
+            entry.pins -= 1
+            self._evict()
+
+    def _insert(self, path: Path, pins: int) -> _Entry:
+        try:
+            entry = self._load(path)  # outside of lock - can take a while
+            entry.pins = pins
+            with self._lock:
+                self._entries[path] = entry
+                self._size += entry.size
+                if pins == 0:
+                    self._prefetched[path] = entry.size
+                self._evict()
+            return entry
+        finally:
+            with self._lock:
+                self._loading.pop(path).set()
+
+    def _evict(self) -> None:
+        for path in list(self._entries):
+            if self._size <= self._max_size:
+                return
+            entry = self._entries[path]
+            if entry.pins > 0:
+                continue
+            del self._entries[path]
+            self._prefetched.pop(path, None)
+            self._size -= entry.size
+            entry.close()
+            logger.debug(f"Evicted {path} from payload cache")
+
+    def _load(self, path: Path) -> _Entry:
+        logger.info(f"Opening {path}")
+        with path.open("rb") as file:
+            size = path.stat().st_size
+            if self._mmap_threshold is not None and size >= max(
+                1, self._mmap_threshold
+            ):
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                return _Entry(memoryview(mapping), size, mapping=mapping)
+            data = file.read()
+            return _Entry(data, len(data))
@@ -0,0 +1,38 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing deduplication of cases by contents of their data.
+"""
+
+import logging
+from typing import Iterable, Iterator
+
+from ..results import Results
+from .instance import CaseId, CaseInstance
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-few-public-methods
+class Deduplicator:
+    """
+    Skips cases which data has the same contents as data of one of previous cases
+    (in the same iteration - repeats are intended). Skipped cases are recorded
+    in the results along with the case executed instead.
+    """
+
+    def __init__(self, results: Results):
+        self._results = results
+        self._executed: dict[tuple[bytes, int], CaseId] = {}
+
+    def wrap(self, instances: Iterable[CaseInstance]) -> Iterator[CaseInstance]:
+        for instance in instances:
+            key = (instance.data.digest(), instance.identifier.iteration)
+            if (executed := self._executed.get(key)) is not None:
+                logger.info(f"Skipping {instance.identifier}, same as {executed}")
+                self._results.add_duplicate(instance.identifier, executed)
+                continue
+            self._executed[key] = instance.identifier
+            yield instance
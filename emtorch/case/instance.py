@@ -8,20 +8,27 @@ Module representing specific case instance (with id and data).
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 from ..arguments import Arguments, RepeatMode
+from .cache import Payload, PayloadCache
+from .source import CaseSource
 
 logger = logging.getLogger(__name__)
 
 
 class CaseData:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, cache: PayloadCache | None = None):
         self._path = path
         self._id = str(path)
-        self._contents: bytes | None = None
+        self._cache = cache if cache is not None else PayloadCache(0)
+        self._contents: Payload | None = None
+        self._users = 0  # cases in progress using the data
+        self._lock = threading.Lock()
 
     @property
     def path(self) -> Path:
@@ -32,12 +39,33 @@ class CaseData:
         return self._id
 
     @property
-    def contents(self) -> bytes:
-        if self._contents is None:
-            logger.info(f"Opening {self._path}")
-            with self._path.open("rb") as file:
-                self._contents = file.read()
-        return self._contents
+    def contents(self) -> Payload:
+        with self._lock:
+            if self._contents is None:
+                self._contents = self._cache.acquire(self._path)
+            return self._contents
+
+    def prefetch(self, max_size: int) -> None:
+        self._cache.prefetch(self._path, max_size)
+
+    def digest(self) -> bytes:
+        with self._path.open("rb") as file:
+            return hashlib.file_digest(file, "sha256").digest()
+
+    def retain(self) -> None:
+        with self._lock:
+            self._users += 1
+
+    def release(self) -> None:
+        """
+        Releases data when case is finished - contents can be evicted from the cache
+        once all cases using the data are finished.
+        """
+        with self._lock:
+            self._users -= 1
+            if self._users == 0 and self._contents is not None:
+                self._cache.release(self._path)
+                self._contents = None
 
 
 class CaseId:
@@ -90,18 +118,48 @@ class CaseInstance:
 
     @staticmethod
     def list_from(args: Arguments) -> list[CaseInstance]:
-        data = [CaseData(p) for p in args.data]
+        return list(CaseInstance.stream_from(args))
 
+    @staticmethod
+    def stream_from(
+        args: Arguments, cache: PayloadCache | None = None
+    ) -> Iterator[CaseInstance]:
+        """
+        Lazily creates cases - inputs are expanded (and data created) just in time.
+        """
+        source = CaseSource(args.data)
+        if cache is None:
+            cache = PayloadCache(args.cache_size, args.mmap_threshold)
+
+        def scan() -> Iterator[CaseData]:
+            yield from (CaseData(path, cache) for path in source)
+
+        abab = args.repeats > 1 and args.repeat_mode == RepeatMode.ABAB
+        if abab and not source.rescannable:
+            raise ValueError("Standard input can not be repeated in ABAB mode")
+        return CaseInstance.repeated(args, scan)
+
+    @staticmethod
+    def repeated(
+        args: Arguments, scan: Callable[[], Iterator[CaseData]]
+    ) -> Iterator[CaseInstance]:
+        """
+        Creates cases from data (`scan` is called again for each round in ABAB mode).
+        """
         if args.repeats < 2:
-            return [CaseInstance(CaseId.from_id(d.identifier), d) for d in data]
+            for data in scan():
+                yield CaseInstance(CaseId.from_id(data.identifier), data)
+            return
 
+        id_builder = CaseId.builder_from(args)
         match args.repeat_mode:
             case RepeatMode.AABB:
-                pairs = ((d, i) for d in data for i in range(args.repeats))
+                for data in scan():
+                    for i in range(args.repeats):
+                        yield CaseInstance(id_builder(data.identifier, i), data)
             case RepeatMode.ABAB:
-                pairs = ((d, i) for i in range(args.repeats) for d in data)
+                for i in range(args.repeats):
+                    for data in scan():
+                        yield CaseInstance(id_builder(data.identifier, i), data)
             case _:
                 raise ValueError(f"Unsupported repeat mode: {args.repeat_mode!r}")
-
-        id_builder = CaseId.builder_from(args)
-        return [CaseInstance(id_builder(d.identifier, i), d) for d, i in pairs]
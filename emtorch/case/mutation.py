@@ -0,0 +1,168 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing mutation engine - source of cases data generated in memory.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import random
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from ..arguments import Arguments
+from .cache import Payload
+from .instance import CaseData
+from .source import CaseSource
+
+logger = logging.getLogger(__name__)
+
+MAX_STACKED_MUTATIONS = 4
+MAX_INSERTED_BYTES = 4
+
+
+class GeneratedData(CaseData):
+    """
+    Data generated in memory - written to the file only when its path is needed
+    (removed when all cases using the data are finished).
+    """
+
+    def __init__(self, identifier: str, path: Path, generate: Callable[[], bytes]):
+        super().__init__(path)
+        self._id = identifier
+        self._generate = generate
+        self._written = False
+
+    @property
+    def path(self) -> Path:
+        with self._lock:
+            if not self._written:
+                self._path.write_bytes(self._generated())
+                self._written = True
+        return self._path
+
+    @property
+    def contents(self) -> Payload:
+        with self._lock:
+            return self._generated()
+
+    def prefetch(self, max_size: int) -> None:
+        pass  # generating is cheap
+
+    def digest(self) -> bytes:
+        return hashlib.sha256(self._generate()).digest()
+
+    def release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            self._contents = None
+            if self._written:
+                self._path.unlink(missing_ok=True)
+                self._written = False
+
+    def _generated(self) -> Payload:
+        if self._contents is None:
+            self._contents = self._generate()
+        return self._contents
+
+
+class MutationEngine:
+    """
+    Generates `count` mutants of each seed. Each mutant is a stack of randomly
+    selected mutations, with random generator seeded by `seed` and mutant
+    identifier, so the same mutants are generated in each run (and round).
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        seeds: Iterable[Path],
+        count: int,
+        strategies: Iterable[str],
+        dictionary: list[bytes],
+        seed: int,
+    ):
+        self._seeds = [(path, path.read_bytes()) for path in seeds]
+        self._count = count
+        self._seed = seed
+        self._dictionary = dictionary
+        self._strategies: list[Callable[[bytearray, random.Random], None]] = []
+        for name in strategies:
+            match name:
+                case "bitflip":
+                    self._strategies.append(self._bitflip)
+                case "insert":
+                    self._strategies.append(self._insert)
+                case "splice":
+                    self._strategies.append(self._splice)
+                case "dictionary":
+                    if dictionary:
+                        self._strategies.append(self._token)
+                case _:
+                    raise ValueError(f"Unknown mutation strategy '{name}'")
+        if not self._strategies:
+            raise ValueError("No mutation strategy available")
+        # pylint: disable-next=consider-using-with
+        self._directory = tempfile.TemporaryDirectory(prefix="emtorch-")
+        logger.info(f"Generating {count} mutants of {len(self._seeds)} seeds")
+
+    def generate(self) -> Iterator[CaseData]:
+        width = len(str(self._count - 1))
+        for number, (path, data) in enumerate(self._seeds):
+            for i in range(self._count):
+                identifier = f"{path}~{i:0{width}}"
+                yield GeneratedData(
+                    identifier,
+                    Path(self._directory.name)
+                    / f"{path.stem}-{number}-{i}{path.suffix}",
+                    functools.partial(self.mutate, data, identifier),
+                )
+
+    def mutate(self, data: bytes, identifier: str) -> bytes:
+        rng = random.Random(f"{self._seed}:{identifier}")
+        result = bytearray(data)
+        for _ in range(rng.randint(1, MAX_STACKED_MUTATIONS)):
+            rng.choice(self._strategies)(result, rng)
+        return bytes(result)
+
+    @staticmethod
+    def _bitflip(data: bytearray, rng: random.Random) -> None:
+        if data:
+            data[rng.randrange(len(data))] ^= 1 << rng.randrange(8)
+
+    @staticmethod
+    def _insert(data: bytearray, rng: random.Random) -> None:
+        inserted = rng.randbytes(rng.randint(1, MAX_INSERTED_BYTES))
+        position = rng.randint(0, len(data))
+        data[position:position] = inserted
+
+    def _splice(self, data: bytearray, rng: random.Random) -> None:
+        _, other = rng.choice(self._seeds)
+        head, tail = rng.randint(0, len(data)), rng.randint(0, len(other))
+        data[head:] = other[tail:]
+
+    def _token(self, data: bytearray, rng: random.Random) -> None:
+        token = rng.choice(self._dictionary)
+        position = rng.randint(0, len(data))
+        if rng.random() < 0.5:  # insert or overwrite
+            data[position:position] = token
+        else:
+            end = position + len(token)
+            data[position:end] = token
+
+    @classmethod
+    def from_args(cls, args: Arguments) -> MutationEngine:
+        dictionary: list[bytes] = []
+        if args.dictionary is not None:
+            with args.dictionary.open("rb") as f:
+                dictionary = [line.rstrip(b"\r\n") for line in f if line.strip()]
+        seeds = CaseSource(args.data)  # loaded once, used by each round
+        return cls(seeds, args.mutations, args.mutators, dictionary, args.mutation_seed)
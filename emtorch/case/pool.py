@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing pool of (identical) targets executing cases in parallel.
+"""
+
+import logging
+import threading
+from typing import Iterable, Iterator, Self
+
+from ..config import Config
+from ..context import Context
+from ..context.template import substitute_variables
+from . import Case
+from .instance import CaseInstance
+
+logger = logging.getLogger(__name__)
+
+
+class Target:
+    def __init__(self, context: Context, case: Case):
+        self._context = context
+        self._case = case
+
+    @property
+    def name(self) -> str:
+        return self._context.target
+
+    def execute(self, instance: CaseInstance) -> None:
+        with self._context.enter_case(instance) as case_context:
+            self._case.execute(case_context)
+            self._case.wait_between_cases(case_context)
+
+    def finish(self) -> None:
+        self._case.wait_for_host_checks()
+
+    @classmethod
+    def from_config(cls, config: Config, context: Context) -> Self:
+        name = config.get_str("name")
+        variables = config.section("variables").to_dict()
+        target_config = Config(
+            substitute_variables(context.config_root.to_dict(), variables)
+        )
+        target_context = context.for_target(name, target_config)
+        return cls(target_context, Case.from_config(target_context))
+
+
+class TargetPool:
+    """
+    Dispatches cases to whichever target is free. Without targets configured
+    cases are executed one by one, on the main thread, using root context.
+    """
+
+    def __init__(self, targets: list[Target]):
+        self._targets = targets
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._errors: list[BaseException] = []
+
+    def execute(self, instances: Iterable[CaseInstance]) -> None:
+        if len(self._targets) == 1:
+            try:
+                for instance in instances:
+                    self._targets[0].execute(instance)
+            finally:
+                self._targets[0].finish()
+            return
+
+        cases = iter(instances)
+        threads = [
+            threading.Thread(
+                name=f"target-{target.name}",
+                target=self._execute_on,
+                args=(target, cases),
+            )
+            for target in self._targets
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+    def _next_case(self, cases: Iterator[CaseInstance]) -> CaseInstance | None:
+        with self._lock:
+            if self._stop.is_set():
+                return None
+            return next(cases, None)
+
+    def _execute_on(self, target: Target, cases: Iterator[CaseInstance]) -> None:
+        try:
+            try:
+                while (instance := self._next_case(cases)) is not None:
+                    logger.info(f"Executing {instance.identifier} on <{target.name}>")
+                    target.execute(instance)
+            finally:
+                target.finish()
+        except BaseException as ex:  # pylint: disable=broad-exception-caught
+            logger.error(f"Target <{target.name}> failed: {ex!r}")
+            self._errors.append(ex)
+            self._stop.set()
+
+    @classmethod
+    def from_config(cls, context: Context) -> Self:
+        targets = context.config_root.get_config_list("targets", fallback=[])
+        if not targets:
+            return cls([Target(context, Case.from_config(context))])
+        logger.info(f"Using pool of {len(targets)} targets")
+        return cls([Target.from_config(t, context) for t in targets])
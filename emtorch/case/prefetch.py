@@ -0,0 +1,68 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing prefetching of cases data while previous cases are executed.
+"""
+
+import logging
+import queue
+import threading
+from collections import deque
+from types import TracebackType
+from typing import Iterable, Iterator, Self
+
+from .instance import CaseData, CaseInstance
+
+logger = logging.getLogger(__name__)
+
+
+class Prefetcher:
+    """
+    Loads (in the background) payloads of up to `depth` cases following the one
+    being executed, as long as prefetched payloads not used yet fit in `max_size`.
+    """
+
+    def __init__(self, depth: int, max_size: int):
+        self._depth = depth
+        self._max_size = max_size
+        self._queue: queue.Queue[CaseData | None] = queue.Queue()
+        self._thread = threading.Thread(name="prefetch", target=self._process)
+
+    def wrap(self, instances: Iterable[CaseInstance]) -> Iterator[CaseInstance]:
+        if self._depth < 1:
+            yield from instances
+            return
+        lookahead: deque[CaseInstance] = deque()
+        for instance in instances:
+            lookahead.append(instance)
+            self._queue.put(instance.data)
+            if len(lookahead) > self._depth:
+                yield lookahead.popleft()
+        yield from lookahead
+
+    def _process(self) -> None:
+        while (data := self._queue.get()) is not None:
+            try:
+                data.prefetch(self._max_size)
+            except OSError as ex:
+                logger.warning(f"Prefetching {data.identifier} failed: {ex}")
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        try:
+            while True:  # not needed anymore
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._queue.put(None)
+        self._thread.join()
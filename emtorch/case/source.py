@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing source of cases data - lazily expanded list of inputs.
+"""
+
+import glob
+import logging
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+STDIN = Path("-")
+LIST_FILE_PREFIX = "@"
+
+_GLOB_CHARS = re.compile(r"[*?[]")
+
+
+def is_explicit_file(spec: Path) -> bool:
+    """
+    Checks whether input is just a path to the data file (not a list, glob, etc.).
+    """
+    return (
+        spec != STDIN
+        and not str(spec).startswith(LIST_FILE_PREFIX)
+        and _GLOB_CHARS.search(str(spec)) is None
+        and not spec.is_dir()
+    )
+
+
+class CaseSource:
+    """
+    Yields data files from inputs being: files, directories (searched recursively),
+    glob patterns, files listing paths (one per line, `@` prefixed) or `-` (list read
+    from standard input). Nothing is gathered up front, so memory usage does not
+    depend on the size of the corpus.
+    """
+
+    def __init__(self, specs: list[Path]):
+        self._specs = specs
+
+    @property
+    def rescannable(self) -> bool:
+        """
+        Whether source can be iterated more than once (standard input can not).
+        """
+        return STDIN not in self._specs
+
+    def __iter__(self) -> Iterator[Path]:
+        for spec in self._specs:
+            if spec == STDIN:
+                yield from self._listed(sys.stdin)
+            elif str(spec).startswith(LIST_FILE_PREFIX):
+                with open(str(spec)[1:], encoding="utf-8") as f:
+                    yield from self._listed(f)
+            elif _GLOB_CHARS.search(str(spec)) is not None:
+                yield from self._files(
+                    Path(p) for p in glob.iglob(str(spec), recursive=True)
+                )
+            elif spec.is_dir():
+                yield from self._walk(spec)
+            else:
+                yield spec  # explicit files are validated with the arguments
+
+    @classmethod
+    def _listed(cls, lines: Iterator[str]) -> Iterator[Path]:
+        yield from cls._files(Path(line.strip()) for line in lines if line.strip())
+
+    @staticmethod
+    def _files(paths: Iterator[Path]) -> Iterator[Path]:
+        for path in paths:
+            if path.is_file():
+                yield path
+            elif not path.is_dir():  # directories matched by globs are skipped
+                logger.error(f"Skipping input not being a file: {path}")
+
+    @classmethod
+    def _walk(cls, directory: Path) -> Iterator[Path]:
+        # only entries of a single directory are held at a time, sorted to keep order
+        with os.scandir(directory) as it:
+            entries = sorted((e.name, e.is_dir()) for e in it)
+        for name, is_dir in entries:
+            if is_dir:
+                yield from cls._walk(directory / name)
+            else:
+                yield directory / name
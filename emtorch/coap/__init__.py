@@ -43,11 +43,11 @@ class CoapMonitor(TypedSubTask[CoapMonitorResult]):
 
         self._validator: Validator | None = None
         self._socket: UdpClientSocket | None = None
-        self._queue: SendQueue[tuple[NetworkAddress, bytes]] | None = None
+        self._queue: SendQueue[tuple[NetworkAddress, bytes | memoryview]] | None = None
 
     def start(self, context: CaseContext) -> CoapMonitorResult | SubTask.StartedType:
-        self._queue = self._io.make_queue(tuple[NetworkAddress, bytes])
-        self._validator = Validator(self._target, self._response_timeout)
+        self._queue = self._io.make_queue(tuple[NetworkAddress, bytes | memoryview])
+        self._validator = Validator(self._target, self._response_timeout, self._io)
         self._socket = UdpClientSocket(self.name + ".udp", self._queue, self._validator)
         self._io.register(self._socket)
         return SubTask.STARTED
@@ -67,7 +67,7 @@ class CoapMonitor(TypedSubTask[CoapMonitorResult]):
     def result_type(self) -> type[CoapMonitorResult]:
         return CoapMonitorResult
 
-    def send(self, data: bytes) -> None:
+    def send(self, data: bytes | memoryview) -> None:
         assert self._queue is not None
         self._queue.put((self._target, data))
 
@@ -108,5 +108,7 @@ class CoapSend(TypedSubTask[Validator.Result]):
     def from_config(cls, name: str, config: Config, context: Context) -> Self:
         return cls(
             name=name,
-            monitor=context.data(CoapMonitor, config.get_str("monitor")),
+            monitor=context.data(
+                CoapMonitor, context.qualify(config.get_str("monitor"))
+            ),
         )
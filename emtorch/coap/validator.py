@@ -10,13 +10,21 @@ import logging
 import threading
 from enum import StrEnum, auto
 
+from ..io import IOLoop, Timer
 from ..io.net import NetworkAddress, NetworkObserver
 from .code import code_reports_success, code_to_string, decode_code
 
 logger = logging.getLogger(__name__)
 
+# fallback when the timer is not armed (message not sent by the I/O thread)
+_RESULT_WAIT_MARGIN = 1.0
 
-class Validator(NetworkObserver):
+
+class Validator(NetworkObserver):  # pylint: disable=too-many-instance-attributes
+    """
+    Validates responses to sent messages. Response timeout is measured
+    by the I/O loop timer, from the moment the message is sent.
+    """
 
     class Result(StrEnum):
         SUCCESS = auto()
@@ -26,9 +34,11 @@ class Validator(NetworkObserver):
         OPERATION_FAILURE = auto()
         TIMEOUT = auto()
 
-    def __init__(self, expected_ip: NetworkAddress, timeout: float):
+    def __init__(self, expected_ip: NetworkAddress, timeout: float, io: IOLoop):
         self.expected_ip = expected_ip
         self.timeout = timeout
+        self.io = io
+        self.timer: Timer | None = None
 
         self.cond = threading.Condition()
         self.expecting = False
@@ -42,6 +52,7 @@ class Validator(NetworkObserver):
                 self.__unexpected_message()
                 return
             self.expecting = False
+            self.__cancel_timer()
             self.result = self.check_message(address, data)
             self.cond.notify()
 
@@ -66,18 +77,22 @@ class Validator(NetworkObserver):
 
         return self.Result.SUCCESS
 
-    def on_write(self, address: NetworkAddress, data: bytes) -> None:
+    def on_write(self, address: NetworkAddress, data: bytes | memoryview) -> None:
         with self.cond:
             self.expecting = True
             self.result = self.Result.UNKNOWN
+            self.__cancel_timer()
+            self.timer = self.io.call_later(self.timeout, self.__on_timeout)
 
     def wait_for_result(self) -> Result:
         with self.cond:
             if not self.cond.wait_for(
-                lambda: self.result != self.Result.UNKNOWN, timeout=self.timeout
+                lambda: self.result != self.Result.UNKNOWN,
+                self.timeout + _RESULT_WAIT_MARGIN,
             ):
+                logger.warning("Operation timed out (message not sent)")
                 self.expecting = False
-                logger.warning("Operation timed out")
+                self.__cancel_timer()
                 return self.Result.TIMEOUT
             result = self.result
             self.result = self.Result.UNKNOWN
@@ -86,6 +101,20 @@ class Validator(NetworkObserver):
     def extra_stats(self) -> dict[str, int]:
         return {"unexpected_messages": self.unexpected_messages}
 
+    def __on_timeout(self) -> None:
+        with self.cond:
+            if not self.expecting:
+                return
+            self.expecting = False
+            logger.warning("Operation timed out")
+            self.result = self.Result.TIMEOUT
+            self.cond.notify()
+
+    def __cancel_timer(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
     def __unexpected_message(self) -> None:
         logger.warning("Message unexpected at this stage")
         self.unexpected_messages += 1
@@ -28,6 +28,8 @@ class Config:
 
     def _get_value(self, path: str, *subpath: str) -> Any:
         if subpath:
+            if self._obj.get(path) is None:
+                return None  # missing section - value can still fall back
             # pylint: disable=protected-access
             return self.section(path)._get_value(*subpath)
         return self._obj.get(path)
@@ -93,12 +95,18 @@ class Config:
             )
         return cast(list[T], value)
 
-    def get_config_list(self, path: str, *subpath: str) -> list[Self]:
+    def get_config_list(
+        self, path: str, *subpath: str, fallback: list[Self] | None = None
+    ) -> list[Self]:
+        if fallback is not None and self._get_value(path, *subpath) is None:
+            return fallback
         value = self._get_list_typed(path, *subpath, value_type=dict)
         return [self.__class__(v) for v in value]
 
-    def get_str_list(self, path: str, *subpath: str) -> list[str]:
-        return self._get_list_typed(path, *subpath, value_type=str)
+    def get_str_list(
+        self, path: str, *subpath: str, fallback: list[str] | None = None
+    ) -> list[str]:
+        return self._get_list_typed(path, *subpath, value_type=str, fallback=fallback)
 
     def to_dict(self) -> dict[str, Any]:
         return self._obj
@@ -8,13 +8,16 @@ Subpackage representing context of the experiment.
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
+from enum import StrEnum
 from types import TracebackType
-from typing import Self, cast
+from typing import Any, Callable, Self, cast
 
 from ..case.instance import CaseInstance
 from ..config import Config
-from ..results import Results
+from ..results import Results, SubTaskResults
+from ..results.values import Value
 
 
 class Worker(ABC):
@@ -26,14 +29,31 @@ class Worker(ABC):
     def stop(self) -> None:
         pass
 
+    @classmethod
+    def from_config(cls, config: Config) -> Self:  # pylint: disable=unused-argument
+        """
+        Creates worker (can be overridden to select implementation using config).
+        """
+        return cls()
 
-class Context:
+    def report(self, info: dict[str, Any]) -> None:
+        """
+        Adds statistics of the (stopped) worker to results info.
+        """
 
-    def __init__(self, config: Config):
-        self._workers: dict[type[Worker], Worker] = {}
+
+class Context:  # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, config: Config, parent: Context | None = None, target: str = ""):
+        self._workers: dict[type[Worker], Worker] = parent._workers if parent else {}
+        self._cleanups: list[Callable[[], None]] = parent._cleanups if parent else []
         self._data: dict[str, object] = {}
         self._config = config
-        self._results = Results(config)
+        self._results = parent.results if parent else Results(config)
+        self._target = target
+        self._targets: int = 0
+        # replicas share results registered by the first target created from the parent
+        self._replica = parent is not None and parent._targets > 0
 
     @property
     def config_root(self) -> Config:
@@ -43,20 +63,58 @@ class Context:
     def results(self) -> Results:
         return self._results
 
+    @property
+    def target(self) -> str:
+        return self._target
+
+    def for_target(self, name: str, config: Config) -> Context:
+        """
+        Creates context for a single target of the pool - workers and results are
+        shared with this context, data and configuration are target-specific.
+        """
+        context = Context(config, self, name)
+        self._targets += 1
+        return context
+
+    def qualify(self, name: str) -> str:
+        return f"{name}@{self._target}" if self._target else name
+
+    def register_subtask(self, name: str, results: type[StrEnum]) -> SubTaskResults:
+        name = name.removesuffix(self.qualify(""))  # results are shared between targets
+        if self._replica:
+            return self.results.subtasks[name]
+        return self.results.register_subtask(name, results)
+
+    def register_value(self, name: str, value: Value) -> Value:
+        if self._replica:
+            return self.results.values[name]
+        return self.results.register_value(name, value)
+
     def worker[T: Worker](self, worker: type[T]) -> T:
         if instance := self._workers.get(worker):
             return cast(T, instance)
 
-        instance = worker()
+        instance = worker.from_config(self.config_root)
         instance.start()
 
         self._workers[worker] = instance
 
         return instance
 
+    def add_cleanup(self, cleanup: Callable[[], None]) -> None:
+        """
+        Registers function called at the end of the run (before workers are stopped).
+        """
+        self._cleanups.append(cleanup)
+
     def teardown(self) -> None:
+        for cleanup in reversed(self._cleanups):
+            cleanup()
+        self._cleanups.clear()
+
         for w in self._workers.values():
             w.stop()
+            w.report(self.results.info)
 
         self._workers.clear()
 
@@ -93,8 +151,11 @@ class CaseContext:
     def __init__(self, parent: Context, case: CaseInstance):
         self._parent = parent
         self._case = case
+        self._pending = 1  # released when leaving the context
+        self._lock = threading.Lock()
 
         self.results.add_case(self.case.identifier)
+        self.case.data.retain()
 
     @property
     def parent(self) -> Context:
@@ -108,6 +169,22 @@ class CaseContext:
     def results(self) -> Results:
         return self._parent.results
 
+    def hold(self) -> None:
+        """
+        Marks the case as still in progress after leaving the context
+        (e.g. some sub-tasks are executed in the background), until `release`.
+        """
+        with self._lock:
+            self._pending += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished:
+            self.case.data.release()
+            self.results.finish_case(self.case.identifier)
+
     def __enter__(self) -> Self:
         return self
 
@@ -117,7 +194,9 @@ class CaseContext:
         exc_value: BaseException | None,
         exc_traceback: TracebackType | None,
     ) -> None:
-        pass
+        # interrupted case is not finished - it will be executed again when resumed
+        if exc_type is None:
+            self.release()
 
 
 __all__ = ["Context", "CaseContext", "Worker"]
@@ -6,18 +6,73 @@
 Provides Template class based on string.Template ($-string) but case-sensitive.
 """
 
-from re import RegexFlag
+from re import Match, RegexFlag
 from string import Template as StringTemplate
+from typing import Any, Iterator, Mapping
 
 from . import CaseContext
 
 
+class _CaseVariables(Mapping[str, str]):
+    """
+    Variables evaluated only when referenced (e.g. generated data is written
+    to the file only when its path is needed).
+    """
+
+    NAMES = ("EMTORCH_CASE_ID", "EMTORCH_DATA_PATH")
+
+    def __init__(self, context: CaseContext):
+        self._context = context
+
+    def __getitem__(self, name: str) -> str:
+        match name:
+            case "EMTORCH_CASE_ID":
+                return self._context.case.identifier.unique
+            case "EMTORCH_DATA_PATH":
+                return str(self._context.case.data.path)
+            case _:
+                raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.NAMES)
+
+    def __len__(self) -> int:
+        return len(self.NAMES)
+
+
 class Template(StringTemplate):
     idpattern = r"[A-Za-z][_A-Za-z0-9]*"
     flags = RegexFlag(0)
 
     def evaluate(self, context: CaseContext) -> str:
-        return self.safe_substitute(
-            EMTORCH_CASE_ID=context.case.identifier.unique,
-            EMTORCH_DATA_PATH=str(context.case.data.path),
-        )
+        return self.safe_substitute(_CaseVariables(context))
+
+
+def substitute_variables(value: Any, variables: Mapping[str, Any]) -> Any:
+    """
+    Replaces references to `variables` in all strings of (nested) configuration value.
+    Other $-references (and `$$` escapes) are left untouched, so they can still be
+    evaluated later. A string being a single reference takes the referenced value
+    as-is (e.g. integer port number).
+    """
+
+    def replace(match: Match[str]) -> str:
+        name = match.group("named") or match.group("braced")
+        if name in variables:
+            return str(variables[name])
+        return match.group(0)
+
+    match value:
+        case str():
+            single = Template.pattern.fullmatch(value)
+            if single is not None:
+                name = single.group("named") or single.group("braced")
+                if name in variables:
+                    return variables[name]
+            return Template.pattern.sub(replace, value)
+        case list():
+            return [substitute_variables(v, variables) for v in value]
+        case dict():
+            return {k: substitute_variables(v, variables) for k, v in value.items()}
+        case _:
+            return value
@@ -11,6 +11,8 @@ import time
 from typing import Self
 
 from .config import Config
+from .context import Context
+from .probe import Probe, probe_from_config
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +30,52 @@ class Delay:
     def name(self) -> str:
         return ".".join(self.prefix)
 
-    def wait(self) -> None:
+    def wait(self) -> float:
         logger.info(f"Waiting on {self.name()} ({self.value}s)")
         time.sleep(self.value)
         logger.info(f"Wait on {self.name()} done")
+        return self.value
 
     @classmethod
     def from_config(cls, *prefix: str, config: Config) -> Self:
         return cls(config.get_float(*prefix), *prefix)
+
+
+class ConditionalDelay(Delay):
+    """
+    Delay waiting up to a given number of seconds, finished as soon as the probe succeeds.
+    """
+
+    def __init__(self, value: float, probe: Probe, *prefix: str):
+        super().__init__(value, *prefix)
+        self.probe = probe
+
+    def wait(self) -> float:
+        logger.info(f"Waiting on {self.name()} (up to {self.value}s)")
+        t0 = time.monotonic()
+        ready = self.probe.wait(self.value)
+        waited = time.monotonic() - t0
+        if ready:
+            logger.info(f"Wait on {self.name()} done, ready after {waited:.3f}s")
+        else:
+            logger.warning(f"Wait on {self.name()} done, not ready after {waited:.3f}s")
+        return waited
+
+    @classmethod
+    def from_probe_config(cls, *prefix: str, context: Context) -> Self:
+        config = context.config_root.section(*prefix)
+        return cls(
+            config.get_float("max"),
+            probe_from_config(config.section("probe"), context),
+            *prefix,
+        )
+
+
+def delay_from_config(*prefix: str, context: Context) -> Delay:
+    """
+    Creates fixed delay (number of seconds) or conditional one (object with probe).
+    """
+    try:
+        return Delay.from_config(*prefix, config=context.config_root)
+    except TypeError:
+        return ConditionalDelay.from_probe_config(*prefix, context=context)
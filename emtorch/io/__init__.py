@@ -6,130 +6,209 @@
 I/O handling components.
 """
 
+import heapq
 import logging
-import os
 import queue
 import selectors
 import threading
-from abc import ABC, abstractmethod
-from typing import Protocol
+import time
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from typing import Any, Callable, Self
 
+from ..config import Config
 from ..context import Worker
+from .base import (
+    Closeable,
+    InterruptPipe,
+    IOBackend,
+    Selectable,
+    SendQueue,
+    Timer,
+    fileno_of,
+    has_remaining_data,
+)
+from .stats import DEFAULT_SLOW_CALLBACK, LoopStats
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CLOSE_TIMEOUT = 1.0
+DEFAULT_STATS_INTERVAL = 60.0
 
-class Closeable(Protocol):
-    def fileno(self) -> int:
-        pass
 
-    def close(self) -> None:
-        pass
+@dataclass
+class Shard:
+    """
+    Additional loop handling selectables with names matching any of `patterns`
+    (`fnmatch` style) or of given `priority` class.
+    """
 
+    name: str
+    backend: IOBackend
+    patterns: list[str] = field(default_factory=list)
+    priority: str = ""
 
-class Selectable(ABC):
-    def __init__(self, name: str):
-        self._name = name
+    def accepts(self, selectable: Selectable) -> bool:
+        if self.priority and selectable.priority == self.priority:
+            return True
+        return any(fnmatch(selectable.name(), p) for p in self.patterns)
 
-    def name(self) -> str:
-        return self._name
+    @classmethod
+    def from_config(cls, config: Config, backend: IOBackend) -> Self:
+        return cls(
+            name=config.get_str("name"),
+            backend=backend,
+            patterns=config.get_str_list("match", fallback=[]),
+            priority=config.get_str("priority", fallback=""),
+        )
 
-    @abstractmethod
-    def fileno(self) -> int:
-        pass
 
-    @abstractmethod
-    def close(self) -> None:
-        pass
-
-    @abstractmethod
-    def is_closed(self) -> bool:
-        pass
-
-    @abstractmethod
-    def wants_to_read(self) -> bool:
-        pass
-
-    @abstractmethod
-    def read(self) -> None:
-        pass
-
-    @abstractmethod
-    def wants_to_write(self) -> bool:
-        pass
-
-    @abstractmethod
-    def write(self) -> None:
-        pass
-
-    @abstractmethod
-    def at_eof(self) -> bool:
-        pass
-
-
-class InterruptPipe(Selectable):
-    def __init__(self) -> None:
-        super().__init__("interrupt-pipe")
-        self._pipe = os.pipe()
-
-    def fileno(self) -> int:
-        return self._pipe[0]
-
-    def write(self) -> None:
-        os.write(self._pipe[1], b"x")
-
-    def read(self) -> None:
-        os.read(self.fileno(), 1024)
-
-    def close(self) -> None:
-        # should be called only when closing IOLoop
-        os.close(self._pipe[0])
-        os.close(self._pipe[1])
-
-    def is_closed(self) -> bool:
-        # never during IOLoop operations
-        return False
-
-    def wants_to_write(self) -> bool:
-        # it should never write through "selection"
-        return False
-
-    def wants_to_read(self) -> bool:
-        return True
-
-    def at_eof(self) -> bool:
-        return False
-
-
-class SendQueue[T](ABC):
-    Empty: type[Exception] = queue.Empty
+class IOLoop(Worker):
+    """
+    I/O worker - handles selectables using backend selected by `io.backend`
+    configuration (`selector` or `asyncio`). Selectables accepted by one of
+    `shards` are handled by its own loop (thread) instead of the main one.
+    Statistics of the loops are logged every `stats_interval` seconds
+    (if positive) and reported in results.
+    """
+
+    def __init__(
+        self,
+        backend: IOBackend | None = None,
+        stats_interval: float = DEFAULT_STATS_INTERVAL,
+        shards: list[Shard] | None = None,
+    ):
+        self._backend = backend if backend is not None else SelectorBackend()
+        self._stats_interval = stats_interval
+        self._shards = shards if shards is not None else []
+        self._owners: dict[int, IOBackend] = {}  # fd -> backend handling it
+        self._owners_lock = threading.Lock()
+
+    @property
+    def stats(self) -> LoopStats:
+        return self._backend.stats
 
-    def __init__(self) -> None:
-        self._queue: queue.Queue[T] = queue.Queue()
+    def start(self) -> None:
+        self._backend.start()
+        for shard in self._shards:
+            logger.info(f"Starting I/O shard '{shard.name}'")
+            shard.backend.start()
+        if self._stats_interval > 0:
+            self.call_later(self._stats_interval, self._log_stats)
+
+    def _log_stats(self, repeat: bool = True) -> None:
+        logger.info(self.stats.summary())
+        for shard in self._shards:
+            logger.info(f"[{shard.name}] {shard.backend.stats.summary()}")
+        if repeat:
+            self.call_later(self._stats_interval, self._log_stats)
 
-    @abstractmethod
-    def put(self, element: T) -> None:
-        pass
+    def stop(self) -> None:
+        for shard in self._shards:
+            shard.backend.stop()
+        self._backend.stop()
 
-    def get(self) -> T:
-        return self._queue.get_nowait()
+    def register(self, selectable: Selectable) -> None:
+        backend = self._backend_for(selectable)
+        with self._owners_lock:
+            self._owners[selectable.fileno()] = backend
+        backend.register(selectable)
 
-    def empty(self) -> bool:
-        return self._queue.empty()
+    def _backend_for(self, selectable: Selectable) -> IOBackend:
+        for shard in self._shards:
+            if shard.accepts(selectable):
+                return shard.backend
+        return self._backend
 
+    def make_queue[T](self, send_type: type[T]) -> SendQueue[T]:
+        return self._backend.make_queue(send_type)
 
-class IOLoop(Worker):
+    def close(self, closeable: Closeable, block: bool = False) -> None:
+        with self._owners_lock:
+            backend = self._owners.pop(fileno_of(closeable), self._backend)
+        backend.close(closeable, block)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedules `callback` to be called by the I/O thread after `delay` seconds
+        (returned timer can be cancelled).
+        """
+        return self._backend.call_later(delay, callback)
+
+    def report(self, info: dict[str, Any]) -> None:
+        self._log_stats(repeat=False)
+        info["io"] = self.stats.to_dict()
+        if self._shards:
+            info["io"]["shards"] = {
+                shard.name: shard.backend.stats.to_dict() for shard in self._shards
+            }
+
+    @classmethod
+    def from_config(cls, config: Config) -> Self:
+        backend = config.get_str("io", "backend", fallback="selector")
+        close_timeout = config.get_float(
+            "io", "close_timeout", fallback=DEFAULT_CLOSE_TIMEOUT
+        )
+        slow_callback = config.get_float(
+            "io", "slow_callback", fallback=DEFAULT_SLOW_CALLBACK
+        )
+
+        def make_backend(thread_name: str) -> IOBackend:
+            match backend:
+                case "selector":
+                    return SelectorBackend(close_timeout, slow_callback, thread_name)
+                case "asyncio":
+                    from .aio import (  # pylint: disable=import-outside-toplevel
+                        AsyncioBackend,
+                    )
 
-    def __init__(self) -> None:
-        self._thread = threading.Thread(name="io-reader", target=self._process)
+                    return AsyncioBackend(close_timeout, slow_callback, thread_name)
+                case _:
+                    raise ValueError(f"Unknown I/O backend '{backend}'")
+
+        return cls(
+            make_backend("io-reader"),
+            config.get_float("io", "stats_interval", fallback=DEFAULT_STATS_INTERVAL),
+            [
+                Shard.from_config(c, make_backend(f"io-{c.get_str('name')}"))
+                for c in config.get_config_list("io", "shards", fallback=[])
+            ],
+        )
+
+
+class SelectorBackend(IOBackend):  # pylint: disable=too-many-instance-attributes
+    """
+    Loop based on `selectors` module. Interest of the selectable (read/write)
+    is re-evaluated only after it received an event or notified about the change,
+    not on every iteration. Timers are kept in a heap, the nearest deadline
+    limits the time spent in `select`.
+    """
+
+    def __init__(
+        self,
+        close_timeout: float = DEFAULT_CLOSE_TIMEOUT,
+        slow_callback: float = DEFAULT_SLOW_CALLBACK,
+        thread_name: str = "io-reader",
+    ) -> None:
+        self.stats = LoopStats(slow_callback)
+        self._thread = threading.Thread(name=thread_name, target=self._process)
         self._stop_request = threading.Event()
         self._interrupt_pipe = InterruptPipe()
         self._register_queue: queue.Queue[Selectable] = queue.Queue()
         self._close_queue: queue.Queue[Closeable] = queue.Queue()
+        self._close_timeout = close_timeout
+        self._closing: list[tuple[Closeable, float]] = []  # with deadlines
         self._selectables: dict[int, Selectable] = {}
+        self._fds: dict[Selectable, int] = {}
         self._selector = selectors.DefaultSelector()
 
+        self._wake_lock = threading.Lock()
+        self._wake_pending = False
+        self._dirty: set[Selectable] = set()
+        self._timers: list[Timer] = []  # heap, guarded by `_wake_lock`
+
         self._perform_register(self._interrupt_pipe)
+        self._update(self._take_dirty())
 
     def start(self) -> None:
         logger.info("Starting I/O thread")
@@ -143,7 +222,9 @@ class IOLoop(Worker):
         for selectable in self._selectables.values():
             selectable.close()
         self._selector.close()
-        logger.info("Stopped subprocess read thread")
+        logger.info(
+            f"Stopped I/O thread ({self.stats.deferred_closes} closes deferred)"
+        )
 
     def register(self, selectable: Selectable) -> None:
         self._register_queue.put(selectable)
@@ -156,8 +237,11 @@ class IOLoop(Worker):
         class Queue(SendQueue[T]):
             def put(self, element: T) -> None:
                 self._queue.put(element)
-                # pylint: disable=protected-access
-                parent._wake_select()
+                if self._owner is not None:
+                    self._owner.interest_changed()
+                else:
+                    # pylint: disable=protected-access
+                    parent._wake_select()
 
         return Queue()
 
@@ -167,61 +251,137 @@ class IOLoop(Worker):
         if block:
             self._close_queue.join()
 
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        timer = Timer(time.monotonic() + delay, callback)
+        with self._wake_lock:
+            heapq.heappush(self._timers, timer)
+            nearest = self._timers[0] is timer
+        if nearest and threading.current_thread() is not self._thread:
+            self._wake_select()  # select may wait longer than the timer delay
+        return timer
+
     def _process(self) -> None:
         while not self._stop_request.is_set():
-            self._sync_registrations()
-            events = self._selector.select()
+            # closeables with remaining data are read without waiting
+            t0 = time.perf_counter()
+            events = self._selector.select(0 if self._closing else self._timeout())
+            self.stats.waited(time.perf_counter() - t0)
 
             if self._stop_request.is_set():
                 return
 
-            something_was_read = self._process_events(events)
-            self._process_register_queue()
-            self._process_close_requests(something_was_read)
-            self._close_eofs()
-            self._clean_closed()
-
-    def _process_events(self, events: list[tuple[selectors.SelectorKey, int]]) -> bool:
-        something_was_read = False
+            if any(key.data is self._interrupt_pipe for key, _ in events):
+                self._drain_wakeups()  # before handling work requested by them
+            self._process_register_queue()  # replacements apply to pending events
+            touched = self._process_events(events)
+            self._process_close_requests()
+            self._run_timers()
+            self._update(touched | self._take_dirty())
+
+    def _timeout(self) -> float | None:
+        with self._wake_lock:
+            while self._timers and not self._timers[0].active():
+                heapq.heappop(self._timers)  # cancelled
+            if not self._timers:
+                return None
+            return max(0.0, self._timers[0].deadline - time.monotonic())
+
+    def _run_timers(self) -> None:
+        now = time.monotonic()
+        due = []
+        with self._wake_lock:
+            while self._timers and self._timers[0].deadline <= now:
+                due.append(heapq.heappop(self._timers))
+        for timer in due:
+            self.stats.fire(timer)
+
+    def _process_events(
+        self, events: list[tuple[selectors.SelectorKey, int]]
+    ) -> set[Selectable]:
+        touched: set[Selectable] = set()
         for key, mask in events:
-            selectable: Selectable = key.data
-            if selectable.is_closed():
+            if key.data is self._interrupt_pipe:
                 continue
+            selectable = self._selectables.get(key.fd)
+            if selectable is None or selectable.is_closed():
+                continue
+            touched.add(selectable)
             if mask & selectors.EVENT_READ:
-                if selectable is not self._interrupt_pipe:
-                    something_was_read = True
-                selectable.read()
+                self.stats.call(selectable, selectable.read)
             if mask & selectors.EVENT_WRITE:
-                selectable.write()
-        return something_was_read
+                self.stats.call(selectable, selectable.write)
+        return touched
+
+    def _drain_wakeups(self) -> None:
+        # flag cleared after draining - wake-up requested before is handled by
+        # this iteration, requested after writes to the pipe again
+        self._interrupt_pipe.read()
+        with self._wake_lock:
+            self._wake_pending = False
+        self.stats.woken()
 
     def _wake_select(self) -> None:
+        with self._wake_lock:
+            if self._wake_pending:
+                return  # not handled yet, single wake-up is enough
+            self._wake_pending = True
         self._interrupt_pipe.write()
 
-    def _perform_register(self, selectable: Selectable) -> None:
-        self._selectables[selectable.fileno()] = selectable
+    def _interest_changed(self, selectable: Selectable) -> None:
+        with self._wake_lock:
+            self._dirty.add(selectable)
+        if threading.current_thread() is not self._thread:
+            self._wake_select()
+
+    def _take_dirty(self) -> set[Selectable]:
+        with self._wake_lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
 
-    def _sync_registrations(self) -> None:
+    def _perform_register(self, selectable: Selectable) -> None:
+        fd = selectable.fileno()
+        if (previous := self._selectables.get(fd)) is not None:
+            self._fds.pop(previous, None)  # replaced by the new one
+        self._selectables[fd] = selectable
+        self._fds[selectable] = fd
+        selectable.watch(self._interest_changed)
+        self._interest_changed(selectable)
+
+    def _forget(self, selectable: Selectable) -> None:
+        fd = self._fds.pop(selectable)
+        del self._selectables[fd]
+        if self._selector.get_map().get(fd) is not None:
+            self._selector.unregister(fd)
+
+    def _update(self, selectables: set[Selectable]) -> None:
         selector_map = self._selector.get_map()
-        for selectable in self._selectables.values():
+        for selectable in selectables:
+            fd = self._fds.get(selectable)
+            if fd is None:
+                continue  # already forgotten
+            if selectable.is_closed():
+                self._forget(selectable)
+                continue
+            if selectable.at_eof():
+                self._forget(selectable)
+                selectable.close()
+                continue
+
             wanted = 0
             if selectable.wants_to_read():
                 wanted |= selectors.EVENT_READ
             if selectable.wants_to_write():
                 wanted |= selectors.EVENT_WRITE
 
-            key = selector_map.get(selectable.fileno())
+            key = selector_map.get(fd)
 
             if wanted == 0:
                 if key is not None:
                     self._selector.unregister(key.fd)
-            else:
-                if key is None:
-                    self._selector.register(
-                        selectable.fileno(), wanted, data=selectable
-                    )
-                elif key.events != wanted:
-                    self._selector.modify(key.fd, wanted, data=selectable)
+            elif key is None:
+                self._selector.register(fd, wanted, data=selectable)
+            elif key.events != wanted or key.data is not selectable:
+                self._selector.modify(fd, wanted, data=selectable)
 
     def _process_register_queue(self) -> None:
         while not self._register_queue.empty():
@@ -230,57 +390,56 @@ class IOLoop(Worker):
             except queue.Empty:
                 return
 
-    def _process_close_requests(self, something_was_read: bool) -> None:
-        if not something_was_read:
-            self._process_close_queue()
-        elif not self._close_queue.empty():
-            self._wake_select()  # requests skipped, but present, let's try next time
-
-    def _process_close_queue(self) -> None:
+    def _process_close_requests(self) -> None:
+        """
+        Closes requested closeables. Remaining data of the closeable is read first,
+        a chunk per iteration (other selectables are not blocked), but no longer
+        than `close_timeout` from the request.
+        """
         while not self._close_queue.empty():
             try:
                 closeable = self._close_queue.get_nowait()
             except queue.Empty:
-                return
-
-            try:
-                self._selector.unregister(closeable.fileno())
-            except Exception:  # pylint: disable=broad-exception-caught
-                pass
-
-            try:
-                self._selectables.pop(closeable.fileno(), None)
-            except Exception:  # pylint: disable=broad-exception-caught
-                pass
-
-            try:
-                closeable.close()
-            except IOError as ex:
-                logger.error(f"Error during closing {ex}, {closeable}")
-
-            self._close_queue.task_done()
-
-    def _clean_closed(self) -> None:
-        closed_fds = [
-            fd for fd, selectable in self._selectables.items() if selectable.is_closed()
-        ]
-        if len(closed_fds) == 0:
-            return
-        selector_map = self._selector.get_map()
-        for fd in closed_fds:
-            if fd in selector_map:
-                self._selector.unregister(fd)
-        self._selectables = {
-            fd: selectable
-            for fd, selectable in self._selectables.items()
-            if not selectable.is_closed()
-        }
-
-    def _close_eofs(self) -> None:
-        for fd, selectable in self._selectables.items():
-            if selectable.at_eof():
-                try:
-                    self._selector.unregister(fd)
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass
-                selectable.close()
+                break
+            self._closing.append((closeable, time.monotonic() + self._close_timeout))
+
+        closing = []
+        for closeable, deadline in self._closing:
+            selectable = self._selectables.get(fileno_of(closeable))
+            if (
+                selectable is not None
+                and has_remaining_data(selectable)
+                and time.monotonic() < deadline
+            ):
+                self.stats.call(selectable, selectable.read)
+                self.stats.deferred_closes += 1
+                closing.append((closeable, deadline))
+            else:
+                self._perform_close(closeable)
+        self._closing = closing
+
+    def _perform_close(self, closeable: Closeable) -> None:
+        fd = fileno_of(closeable)
+        if (selectable := self._selectables.get(fd)) is not None:
+            self._forget(selectable)
+        elif fd >= 0 and self._selector.get_map().get(fd) is not None:
+            self._selector.unregister(fd)
+
+        try:
+            closeable.close()
+        except IOError as ex:
+            logger.error(f"Error during closing {ex}, {closeable}")
+
+        self._close_queue.task_done()
+
+
+__all__ = [
+    "Closeable",
+    "IOBackend",
+    "IOLoop",
+    "Selectable",
+    "SelectorBackend",
+    "SendQueue",
+    "Shard",
+    "Timer",
+]
@@ -0,0 +1,199 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+asyncio based I/O backend.
+"""
+
+import asyncio
+import logging
+import selectors
+import threading
+import time
+from typing import Any, Callable
+
+from .base import (
+    Closeable,
+    IOBackend,
+    Selectable,
+    SendQueue,
+    Timer,
+    fileno_of,
+    has_remaining_data,
+)
+from .stats import LoopStats
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedSelector(selectors.DefaultSelector):  # pylint: disable=too-many-ancestors
+    def __init__(self, stats: LoopStats):
+        super().__init__()
+        self._stats = stats
+
+    def select(
+        self, timeout: float | None = None
+    ) -> list[tuple[selectors.SelectorKey, int]]:
+        t0 = time.perf_counter()
+        try:
+            return super().select(timeout)
+        finally:
+            self._stats.waited(time.perf_counter() - t0)
+
+
+class AsyncioBackend(IOBackend):
+    """
+    Loop running asyncio event loop on its own thread. Selectables are handled
+    by `add_reader`/`add_writer` callbacks, requests from other threads are
+    passed with `call_soon_threadsafe`.
+    """
+
+    def __init__(
+        self, close_timeout: float, slow_callback: float, thread_name: str = "io-reader"
+    ) -> None:
+        self.stats = LoopStats(slow_callback)
+        self._close_timeout = close_timeout
+        self._loop = asyncio.SelectorEventLoop(_TimedSelector(self.stats))
+        self._thread = threading.Thread(name=thread_name, target=self._process)
+        self._selectables: dict[int, Selectable] = {}
+        self._fds: dict[Selectable, int] = {}
+        self._interest: dict[int, tuple[bool, bool]] = {}
+
+    def start(self) -> None:
+        logger.info("Starting I/O thread (asyncio)")
+        self._thread.start()
+
+    def stop(self) -> None:
+        logger.info("Stopping I/O thread (asyncio)")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        for selectable in self._selectables.values():
+            selectable.close()
+        self._loop.close()
+        logger.info("Stopped I/O thread (asyncio)")
+
+    def register(self, selectable: Selectable) -> None:
+        self._threadsafe(self._register, selectable)
+
+    # pylint: disable=unused-argument
+    def make_queue[T](self, send_type: type[T]) -> SendQueue[T]:
+        class Queue(SendQueue[T]):
+            def put(self, element: T) -> None:
+                self._queue.put(element)
+                if self._owner is not None:
+                    self._owner.interest_changed()
+
+        return Queue()
+
+    def close(self, closeable: Closeable, block: bool = False) -> None:
+        done = threading.Event()
+        deadline = time.monotonic() + self._close_timeout
+        self._threadsafe(self._close, closeable, done, deadline)
+        if block:
+            done.wait()
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        timer = Timer(time.monotonic() + delay, callback)
+        self._threadsafe(self._schedule, timer)
+        return timer
+
+    def _schedule(self, timer: Timer) -> None:
+        if timer.active():
+            self._loop.call_later(
+                max(0.0, timer.deadline - time.monotonic()), self.stats.fire, timer
+            )
+
+    def _threadsafe(self, callback: Callable[..., Any], *args: Any) -> None:
+        self.stats.woken()  # counted by the requesting thread (approximate)
+        self._loop.call_soon_threadsafe(callback, *args)
+
+    def _process(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _interest_changed(self, selectable: Selectable) -> None:
+        if threading.current_thread() is self._thread:
+            self._loop.call_soon(self._update, selectable)
+        else:
+            self._threadsafe(self._update, selectable)
+
+    def _register(self, selectable: Selectable) -> None:
+        fd = selectable.fileno()
+        if (previous := self._selectables.get(fd)) is not None:
+            self._forget(previous)  # replaced by the new one
+        self._selectables[fd] = selectable
+        self._fds[selectable] = fd
+        self._interest[fd] = (False, False)
+        selectable.watch(self._interest_changed)
+        self._update(selectable)
+
+    def _forget(self, selectable: Selectable) -> None:
+        fd = self._fds.pop(selectable)
+        del self._selectables[fd]
+        reading, writing = self._interest.pop(fd)
+        if reading:
+            self._loop.remove_reader(fd)
+        if writing:
+            self._loop.remove_writer(fd)
+
+    def _on_read(self, selectable: Selectable) -> None:
+        if not selectable.is_closed():
+            self.stats.call(selectable, selectable.read)
+        self._update(selectable)
+
+    def _on_write(self, selectable: Selectable) -> None:
+        if not selectable.is_closed():
+            self.stats.call(selectable, selectable.write)
+        self._update(selectable)
+
+    def _update(self, selectable: Selectable) -> None:
+        fd = self._fds.get(selectable)
+        if fd is None:
+            return  # already forgotten
+        if selectable.is_closed():
+            self._forget(selectable)
+            return
+        if selectable.at_eof():
+            self._forget(selectable)
+            selectable.close()
+            return
+
+        reading, writing = self._interest[fd]
+        wants_to_read = selectable.wants_to_read()
+        wants_to_write = selectable.wants_to_write()
+        if wants_to_read != reading:
+            if wants_to_read:
+                self._loop.add_reader(fd, self._on_read, selectable)
+            else:
+                self._loop.remove_reader(fd)
+        if wants_to_write != writing:
+            if wants_to_write:
+                self._loop.add_writer(fd, self._on_write, selectable)
+            else:
+                self._loop.remove_writer(fd)
+        self._interest[fd] = (wants_to_read, wants_to_write)
+
+    def _close(
+        self, closeable: Closeable, done: threading.Event, deadline: float
+    ) -> None:
+        """
+        Closes the closeable. Remaining data of the closeable is read first,
+        a chunk per loop iteration (other selectables are not blocked), but no
+        longer than `close_timeout` from the request.
+        """
+        fd = fileno_of(closeable)
+        if (selectable := self._selectables.get(fd)) is not None:
+            if has_remaining_data(selectable) and time.monotonic() < deadline:
+                self._on_read(selectable)
+                self.stats.deferred_closes += 1
+                self._loop.call_soon(self._close, closeable, done, deadline)
+                return
+            if selectable in self._fds:
+                self._forget(selectable)
+
+        try:
+            closeable.close()
+        except IOError as ex:
+            logger.error(f"Error during closing {ex}, {closeable}")
+        done.set()
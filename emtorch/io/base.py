@@ -0,0 +1,228 @@
+# Copyright (c) 2025-2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Base I/O components, shared by I/O backends.
+"""
+
+import logging
+import os
+import queue
+import select
+from abc import ABC, abstractmethod
+from typing import Callable, Protocol
+
+from .stats import LoopStats
+
+logger = logging.getLogger(__name__)
+
+
+class Closeable(Protocol):
+    def fileno(self) -> int:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class Selectable(ABC):
+    priority = "bulk"  # class used to assign the selectable to I/O loop shard
+
+    def __init__(self, name: str):
+        self._name = name
+        self._on_interest_changed: Callable[[Selectable], None] | None = None
+        self.transferred = 0  # bytes read or written, for statistics
+
+    def name(self) -> str:
+        return self._name
+
+    def watch(self, on_interest_changed: Callable[["Selectable"], None]) -> None:
+        """
+        Called by the loop when registered.
+        """
+        self._on_interest_changed = on_interest_changed
+
+    def interest_changed(self) -> None:
+        """
+        Notifies the loop that `wants_to_read` or `wants_to_write` result changed
+        (changes made inside `read` or `write` are detected by the loop itself).
+        """
+        if self._on_interest_changed is not None:
+            self._on_interest_changed(self)
+
+    @abstractmethod
+    def fileno(self) -> int:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def is_closed(self) -> bool:
+        pass
+
+    @abstractmethod
+    def wants_to_read(self) -> bool:
+        pass
+
+    @abstractmethod
+    def read(self) -> None:
+        pass
+
+    @abstractmethod
+    def wants_to_write(self) -> bool:
+        pass
+
+    @abstractmethod
+    def write(self) -> None:
+        pass
+
+    @abstractmethod
+    def at_eof(self) -> bool:
+        pass
+
+
+class InterruptPipe(Selectable):
+    def __init__(self) -> None:
+        super().__init__("interrupt-pipe")
+        self._pipe = os.pipe()
+
+    def fileno(self) -> int:
+        return self._pipe[0]
+
+    def write(self) -> None:
+        os.write(self._pipe[1], b"x")
+
+    def read(self) -> None:
+        os.read(self.fileno(), 1024)
+
+    def close(self) -> None:
+        # should be called only when closing IOLoop
+        os.close(self._pipe[0])
+        os.close(self._pipe[1])
+
+    def is_closed(self) -> bool:
+        # never during IOLoop operations
+        return False
+
+    def wants_to_write(self) -> bool:
+        # it should never write through "selection"
+        return False
+
+    def wants_to_read(self) -> bool:
+        return True
+
+    def at_eof(self) -> bool:
+        return False
+
+
+class SendQueue[T](ABC):
+    Empty: type[Exception] = queue.Empty
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[T] = queue.Queue()
+        self._owner: Selectable | None = None
+
+    def attach(self, owner: Selectable) -> None:
+        """
+        Sets selectable writing elements from the queue (notified when not empty).
+        """
+        self._owner = owner
+
+    @abstractmethod
+    def put(self, element: T) -> None:
+        pass
+
+    def get(self) -> T:
+        return self._queue.get_nowait()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+
+class Timer:
+    """
+    Callback called once by the loop thread at `deadline` (`time.monotonic`),
+    unless cancelled before. Cancelling from another thread does not prevent
+    the callback being executed at the moment.
+    """
+
+    def __init__(self, deadline: float, callback: Callable[[], None]):
+        self.deadline = deadline
+        self._callback = callback
+        self._active = True
+
+    def cancel(self) -> None:
+        self._active = False
+
+    def active(self) -> bool:
+        return self._active
+
+    def fire(self) -> None:
+        if not self._active:
+            return
+        self._active = False
+        try:
+            self._callback()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            logger.error(f"Timer callback error: {ex!r}")
+
+    def __lt__(self, other: "Timer") -> bool:
+        return self.deadline < other.deadline
+
+
+class IOBackend(ABC):
+    """
+    Event loop handling selectables on a single thread.
+    """
+
+    stats: LoopStats
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def register(self, selectable: Selectable) -> None:
+        pass
+
+    @abstractmethod
+    def make_queue[T](self, send_type: type[T]) -> SendQueue[T]:
+        pass
+
+    @abstractmethod
+    def close(self, closeable: Closeable, block: bool = False) -> None:
+        """
+        Closes (from the loop thread) the closeable and unregisters it if needed.
+        """
+
+    @abstractmethod
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedules `callback` to be called by the loop thread after `delay` seconds.
+        """
+
+
+def fileno_of(closeable: Closeable) -> int:
+    try:
+        return closeable.fileno()
+    except ValueError:  # already closed
+        return -1
+
+
+def has_remaining_data(selectable: Selectable) -> bool:
+    """
+    Checks whether selectable requested to be closed has data to be read first.
+    """
+    if selectable.is_closed() or selectable.at_eof():
+        return False
+    if not selectable.wants_to_read():
+        return False
+    readable, _, _ = select.select([selectable], [], [], 0)
+    return bool(readable)
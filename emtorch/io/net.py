@@ -30,5 +30,5 @@ class NetworkObserver(Protocol):
     def on_read(self, address: NetworkAddress, data: bytes) -> None:
         pass
 
-    def on_write(self, address: NetworkAddress, data: bytes) -> None:
+    def on_write(self, address: NetworkAddress, data: bytes | memoryview) -> None:
         pass
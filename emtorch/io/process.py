@@ -0,0 +1,179 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Process related I/O components.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import resource
+import subprocess
+import threading
+import time
+from signal import Signals
+
+from .base import Selectable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KILL_GRACE = 1.0
+_GROUP_POLL_INTERVAL = 0.01
+
+
+class ProcessWatch(Selectable):
+    """
+    Notifies about exit of the process - Linux pidfd becomes readable when the
+    process exits, so the exit is handled by the I/O loop as soon as it happens.
+    The process is reaped with `wait4`, providing its resource usage.
+    """
+
+    def __init__(self, name: str, process: subprocess.Popen[bytes]):
+        super().__init__(name)
+        self._process = process
+        self._pidfd = os.pidfd_open(process.pid)
+        self._closed = False
+        self._exited = threading.Event()
+        self.rusage: resource.struct_rusage | None = None
+        self.exit_time: float | None = None  # `time.monotonic`
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Waits (up to `timeout` seconds) for exit of the process (reaped by the loop).
+        """
+        return self._exited.wait(timeout)
+
+    def fileno(self) -> int:
+        if self._closed:
+            raise ValueError("pidfd already closed")
+        return self._pidfd
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            os.close(self._pidfd)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def at_eof(self) -> bool:
+        return self._exited.is_set()
+
+    def wants_to_read(self) -> bool:
+        return True
+
+    def read(self) -> None:
+        if self._reap():
+            self._exited.set()
+
+    def _reap(self) -> bool:
+        # lock used by Popen.poll/wait (internal), so the process is reaped only once
+        with getattr(self._process, "_waitpid_lock"):
+            if self._process.returncode is not None:
+                return True  # already reaped by Popen
+            try:
+                pid, status, rusage = os.wait4(self._process.pid, os.WNOHANG)
+            except ChildProcessError:
+                return self._process.poll() is not None
+            if pid == 0:
+                return False
+            self.exit_time = time.monotonic()
+            self.rusage = rusage
+            self._process.returncode = os.waitstatus_to_exitcode(status)
+            return True
+
+    def wants_to_write(self) -> bool:
+        return False
+
+    def write(self) -> None:
+        raise RuntimeError("Should be used only for reading")
+
+    @classmethod
+    def create(cls, name: str, process: subprocess.Popen[bytes]) -> ProcessWatch | None:
+        """
+        Creates the watch, or returns None when pidfd is not supported.
+        """
+        try:
+            return cls(name, process)
+        except (AttributeError, OSError) as ex:
+            logger.debug(f"Process exit cannot be watched: {ex!r}")
+            return None
+
+
+class ProcessGroup:
+    """
+    Process group of the process started in a new session - it contains
+    descendants of the process (unless they created their own groups),
+    so they can be found and stopped even after the process exited.
+    """
+
+    def __init__(self, pgid: int):
+        self.pgid = pgid
+
+    def members(self) -> list[int]:
+        """
+        Returns identifiers of live (not zombie) processes of the group.
+        """
+        if not self.exists():
+            return []  # no need to scan all processes
+        try:
+            entries = os.listdir("/proc")
+        except FileNotFoundError:
+            return []  # not supported, only signals are sent
+        result = []
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    stat = f.read()
+            except OSError:
+                continue  # already finished
+            # fields after the command name (in parentheses): state, ppid, pgrp
+            fields = stat.rpartition(b")")[2].split()
+            if fields[0] != b"Z" and int(fields[2]) == self.pgid:
+                result.append(int(entry))
+        return result
+
+    def exists(self) -> bool:
+        """
+        Returns False when no process (including zombies) is left in the group.
+        """
+        try:
+            os.killpg(self.pgid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass  # exists, though not all processes can be signalled
+        return True
+
+    def signal(self, sig: Signals) -> bool:
+        """
+        Sends the signal to all processes of the group, returns False when
+        the group no longer exists.
+        """
+        try:
+            os.killpg(self.pgid, sig)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def stop(
+        self, sig: Signals = Signals.SIGTERM, grace: float = DEFAULT_KILL_GRACE
+    ) -> None:
+        """
+        Sends the signal to the group, escalating to SIGKILL when any of its
+        processes is still alive after `grace` seconds.
+        """
+        if not self.signal(sig):
+            return
+        deadline = time.monotonic() + grace
+        while self.members():
+            if time.monotonic() >= deadline:
+                logger.warning(f"Killing process group {self.pgid}")
+                self.signal(Signals.SIGKILL)
+                return
+            time.sleep(_GROUP_POLL_INTERVAL)
@@ -8,15 +8,24 @@ Socket based network I/O.
 
 import logging
 import socket
+import threading
+import time
 from binascii import hexlify
+from typing import Callable
 
 from . import Selectable, SendQueue
 from .net import NetworkAddress, NetworkObserver
 
 logger = logging.getLogger(__name__)
 
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_PAYLOAD = bytes(56)  # same size as sent by `ping`
+
 
 class Socket(Selectable):
+    priority = "latency"
+
     def __init__(self, name: str, sock: socket.socket):
         super().__init__(name)
         self.socket = sock
@@ -40,15 +49,17 @@ class UdpClientSocket(Socket):
     def __init__(
         self,
         name: str,
-        queue: SendQueue[tuple[NetworkAddress, bytes]],
+        queue: SendQueue[tuple[NetworkAddress, bytes | memoryview]],
         observer: NetworkObserver | None = None,
     ):
         super().__init__(name, socket.socket(socket.AF_INET, socket.SOCK_DGRAM))
         self._queue = queue
+        self._queue.attach(self)
         self._observer = observer
 
     def read(self) -> None:
         data, addr = self.socket.recvfrom(1024)  # TODO pylint: disable=fixme
+        self.transferred += len(data)
         logger.info(
             f"Received {len(data)} bytes from {addr}: {hexlify(data).decode('utf-8')}"
         )
@@ -71,4 +82,78 @@ class UdpClientSocket(Socket):
         )
         if self._observer:
             self._observer.on_write(addr, data)
-        self.socket.sendto(data, addr.as_tuple())
+        self.transferred += self.socket.sendto(data, addr.as_tuple())
+
+
+class IcmpEchoSocket(Socket):
+    """
+    Unprivileged ICMP socket (`SOCK_DGRAM`/`IPPROTO_ICMP`, allowed for groups
+    in `net.ipv4.ping_group_range` on Linux) sending echo requests - the kernel
+    fills identifier and checksum and passes back only replies to this socket.
+    Replies are matched with requests by sequence number, their round trip
+    times passed to `on_reply`.
+    """
+
+    def __init__(self, name: str, host: str, on_reply: Callable[[int, float], None]):
+        address = socket.gethostbyname(host)
+        super().__init__(
+            name, socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        )
+        self.socket.setblocking(False)
+        self._address = (address, 0)
+        self._on_reply = on_reply
+        self._lock = threading.Lock()
+        self._sent: dict[int, float] = {}
+        self._sequence = 0
+
+    def send(self) -> int | None:
+        """
+        Sends echo request (can be called by any thread), returns its sequence
+        number or None when it was not sent.
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            self._sequence = (self._sequence + 1) & 0xFFFF
+            header = bytes([_ICMP_ECHO_REQUEST, 0, 0, 0, 0, 0])
+            packet = header + self._sequence.to_bytes(2, "big") + _ICMP_PAYLOAD
+            self._sent[self._sequence] = time.perf_counter()
+            try:
+                self.transferred += self.socket.sendto(packet, self._address)
+            except OSError as ex:
+                logger.warning(f"Sending echo request to {self._address[0]}: {ex}")
+                return None
+            return self._sequence
+
+    def read(self) -> None:
+        try:
+            data = self.socket.recv(len(_ICMP_PAYLOAD) + 64)
+        except BlockingIOError:
+            return
+        except OSError as ex:
+            logger.warning(f"Receiving echo reply from {self._address[0]}: {ex}")
+            return
+        received = time.perf_counter()
+        self.transferred += len(data)
+        if len(data) < 8 or data[0] != _ICMP_ECHO_REPLY:
+            return
+        sequence = int.from_bytes(data[6:8], "big")
+        with self._lock:
+            sent = self._sent.pop(sequence, None)
+        if sent is None:
+            logger.debug(f"Unexpected echo reply {sequence} from {self._address[0]}")
+            return
+        self._on_reply(sequence, received - sent)
+
+    def close(self) -> None:
+        with self._lock:
+            super().close()
+
+    def wants_to_read(self) -> bool:
+        return True
+
+    def wants_to_write(self) -> bool:
+        return False
+
+    def write(self) -> None:
+        raise RuntimeError("Echo requests are sent directly")
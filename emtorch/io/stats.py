@@ -0,0 +1,117 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+I/O loop instrumentation.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from .base import Selectable, Timer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_CALLBACK = 0.1
+
+
+@dataclass
+class _CallStats:
+    calls: int = 0
+    bytes: int = 0
+    time: float = 0.0
+
+
+class LoopStats:  # pylint: disable=too-many-instance-attributes
+    """
+    Statistics of the I/O loop: time spent waiting for events, time spent
+    handling them (per selectable name), wake-ups by other threads, lag
+    of timers and closes deferred to read remaining data. Updated by the loop
+    thread; callbacks taking longer than `slow_callback` seconds are reported.
+    """
+
+    def __init__(self, slow_callback: float = DEFAULT_SLOW_CALLBACK):
+        self.slow_callback = slow_callback
+        self.iterations = 0
+        self.select_wait = 0.0
+        self.busy = 0.0
+        self.events = 0
+        self.max_event_time = 0.0
+        self.wakeups = 0
+        self.slow_callbacks = 0
+        self.timers = 0
+        self.max_timer_lag = 0.0
+        self.deferred_closes = 0
+        self.selectables: dict[str, _CallStats] = {}
+
+    def waited(self, seconds: float) -> None:
+        self.iterations += 1
+        self.select_wait += seconds
+
+    def woken(self) -> None:
+        self.wakeups += 1
+
+    def call(self, selectable: Selectable, callback: Callable[[], None]) -> None:
+        transferred = selectable.transferred
+        elapsed = self._measure(selectable.name(), callback)
+        stats = self.selectables.setdefault(selectable.name(), _CallStats())
+        stats.calls += 1
+        stats.bytes += selectable.transferred - transferred
+        stats.time += elapsed
+        self.events += 1
+
+    def fire(self, timer: Timer) -> None:
+        self.max_timer_lag = max(self.max_timer_lag, time.monotonic() - timer.deadline)
+        self._measure("timer", timer.fire)
+        self.timers += 1
+
+    def _measure(self, name: str, callback: Callable[[], None]) -> float:
+        t0 = time.perf_counter()
+        try:
+            callback()
+        finally:
+            elapsed = time.perf_counter() - t0
+            self.busy += elapsed
+            self.max_event_time = max(self.max_event_time, elapsed)
+            if elapsed > self.slow_callback:
+                self.slow_callbacks += 1
+                logger.warning(f"Slow I/O callback of {name}: {elapsed * 1000:.1f}ms")
+        return elapsed
+
+    def summary(self, top: int = 3) -> str:
+        busiest = sorted(
+            self.selectables.items(), key=lambda item: item[1].time, reverse=True
+        )[:top]
+        return (
+            f"I/O loop: {self.events} events in {self.iterations} iterations"
+            f", waited {self.select_wait:.1f}s, busy {self.busy:.3f}s"
+            f" (max {self.max_event_time * 1000:.1f}ms)"
+            f", {self.wakeups} wake-ups, {self.slow_callbacks} slow callbacks"
+            f", timer lag up to {self.max_timer_lag * 1000:.1f}ms"
+            f", {self.deferred_closes} closes deferred"
+            + "".join(
+                f"; {name}: {s.calls} calls, {s.bytes} bytes, {s.time:.3f}s"
+                for name, s in busiest
+            )
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "iterations": self.iterations,
+            "select_wait": self.select_wait,
+            "busy": self.busy,
+            "events": self.events,
+            "max_event_time": self.max_event_time,
+            "wakeups": self.wakeups,
+            "slow_callbacks": self.slow_callbacks,
+            "timers": self.timers,
+            "max_timer_lag": self.max_timer_lag,
+            "deferred_closes": self.deferred_closes,
+            "selectables": {k: asdict(v) for k, v in self.selectables.items()},
+        }
@@ -7,12 +7,16 @@ Stream (files, pipes etc.) bases I/O components.
 """
 
 import logging
+import os
 from typing import IO
 
 from . import Selectable
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_READ_SIZE = 64 * 1024
+MAX_READS_PER_EVENT = 16  # let other selectables be handled too
+
 
 class Stream(Selectable):
     def __init__(self, name: str, stream: IO[bytes]):
@@ -57,47 +61,126 @@ class OutputStream(Stream):
 
 
 class StreamWriter(OutputStream):
-    def __init__(self, name: str, stream: IO[bytes], data: bytes):
+    """
+    Writes data to the stream, which is closed once everything is written.
+    Data is consumed through `memoryview` (possibly of memory-mapped file),
+    so partial writes do not copy the remaining data. Contents of `source`
+    file (if any) are written after `data`, read in `chunk_size` chunks.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        name: str,
+        stream: IO[bytes],
+        data: bytes | memoryview = b"",
+        source: IO[bytes] | None = None,
+        chunk_size: int = DEFAULT_READ_SIZE,
+    ):
         super().__init__(name, stream)
-        self._data = data
+        self._view = memoryview(data)
+        self._source = source
+        self._chunk_size = chunk_size
+        os.set_blocking(stream.fileno(), False)
 
     def write(self) -> None:
-        self.logger.info(f"writing {len(self._data)} bytes.")
+        if not self._view and not self._next_chunk():
+            self._finish()
+            return
+        try:
+            written = os.write(self.fileno(), self._view)
+        except BlockingIOError:
+            return
+        except BrokenPipeError:
+            self.logger.warning(
+                f"stream closed by reader after {self.transferred} bytes"
+            )
+            self.mark_eof()
+            return
+
+        self._view = self._view[written:]
+        self.transferred += written
+        if not self._view and not self._next_chunk():
+            self._finish()
+
+    def _next_chunk(self) -> bool:
+        if self._source is None:
+            return False
+        chunk = self._source.read(self._chunk_size)
+        if not chunk:
+            self._source.close()
+            self._source = None
+            return False
+        self._view = memoryview(chunk)
+        return True
 
-        written = self.stream.write(self._data)
-        self._data = self._data[written:]
+    def _finish(self) -> None:
+        self.logger.info(f"wrote {self.transferred} bytes, closing the stream")
+        self.mark_eof()  # closed by the I/O loop
 
-        self.logger.info(f"wrote {written}, {len(self._data)} bytes remaining.")
-        if len(self._data) == 0:
-            self.logger.info("closing the stream")
-            self.close()
+    def close(self) -> None:
+        self._view = memoryview(b"")  # do not keep mapped payload in use
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+        super().close()
 
     def wants_to_write(self) -> bool:
-        return len(self._data) > 0
+        return not self.at_eof()
 
 
 class StreamLogger(InputStream):
-    def __init__(self, name: str, subname: str, stream: IO[bytes]):
+    """
+    Logs lines read from the stream. Stream is switched to non-blocking mode,
+    so each event reads all available data (in `read_size` chunks).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        subname: str,
+        stream: IO[bytes],
+        read_size: int = DEFAULT_READ_SIZE,
+    ):
         super().__init__(name, stream)
         self._subname = subname
+        self._read_size = read_size
+        os.set_blocking(stream.fileno(), False)
 
         self._buffer = bytearray()
 
     def read(self) -> None:
-        data = self.stream.read(4 * 1024)
-        if len(data) == 0:
-            self.mark_eof()
-        for b in data:
-            if b == b"\n"[0]:
-                self._flush()
-            else:
-                self._buffer.append(b)
-
-    def _flush(self) -> None:
-        self.logger.info(f"{self._subname} - {bytes(self._buffer.rstrip())!r}")
-        self._buffer.clear()
+        for _ in range(MAX_READS_PER_EVENT):
+            try:
+                data = os.read(self.fileno(), self._read_size)
+            except BlockingIOError:
+                return
+            if len(data) == 0:
+                self.mark_eof()
+                return
+            self.transferred += len(data)
+            self._split(data)
+            if len(data) < self._read_size:
+                return  # nothing more available
+
+    def _split(self, data: bytes) -> None:
+        *lines, rest = data.split(b"\n")
+        if lines:
+            self._buffer += lines[0]
+            self._log(self._buffer)
+            self._buffer.clear()
+            for line in lines[1:]:
+                self._log(line)
+        self._buffer += rest
+
+    def _log(self, line: bytes | bytearray) -> None:
+        self.logger.info(f"{self._subname} - {bytes(line.rstrip())!r}")
 
     def close(self) -> None:
         if self._buffer:
-            self._flush()
+            self._log(self._buffer)
+            self._buffer.clear()
         super().close()
+
+    def wants_to_read(self) -> bool:
+        return True
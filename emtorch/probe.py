@@ -0,0 +1,169 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing 'probes' - checks whether the target is ready.
+"""
+
+import logging
+import math
+import re
+import socket
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Self
+
+from .config import Config
+from .context import Context
+from .io.net import NetworkAddress
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-few-public-methods
+class Probe(ABC):
+    @abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """
+        Waits (up to `timeout` seconds) for the target to become ready.
+        """
+
+
+class LogProbe(Probe):
+    """
+    Target is ready when matching line is logged by given subtask (while waiting).
+    """
+
+    class _Handler(logging.Handler):
+        def __init__(self, pattern: str, subtask: str):
+            super().__init__()
+            self.regex = re.compile(pattern)
+            self.subtask = subtask
+            self.matched = threading.Event()
+
+        def emit(self, record: logging.LogRecord) -> None:
+            if record.__dict__.get("subtask") == self.subtask:
+                if self.regex.search(record.getMessage()) is not None:
+                    self.matched.set()
+
+    def __init__(self, pattern: str, subtask: str):
+        self._handler = self._Handler(pattern, subtask)
+
+    def wait(self, timeout: float) -> bool:
+        self._handler.matched.clear()
+        root = logging.getLogger()
+        root.addHandler(self._handler)  # only while waiting
+        try:
+            return self._handler.matched.wait(timeout)
+        finally:
+            root.removeHandler(self._handler)
+
+    @classmethod
+    def from_config(cls, config: Config, context: Context) -> Self:
+        return cls(
+            pattern=config.get_str("pattern"),
+            subtask=context.qualify(config.get_str("subtask")),
+        )
+
+
+class UdpProbe(Probe):
+    """
+    Target is ready when it replies to the datagram (sent every `interval`).
+    """
+
+    def __init__(self, target: NetworkAddress, payload: bytes, interval: float):
+        self._target = target
+        self._payload = payload
+        self._interval = interval
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            try:
+                # only datagrams from the target are received (host resolved once)
+                sock.connect(self._target.as_tuple())
+            except OSError as ex:
+                logger.error(f"UDP probe error: {ex}")
+                return False
+            while (remaining := deadline - time.monotonic()) > 0:
+                sock.settimeout(min(self._interval, remaining))
+                try:
+                    sock.send(self._payload)
+                    sock.recv(1024)
+                except TimeoutError:
+                    continue
+                except OSError as ex:  # e.g. ICMP port unreachable
+                    logger.debug(f"UDP probe error: {ex}")
+                    time.sleep(
+                        max(0.0, min(self._interval, deadline - time.monotonic()))
+                    )
+                    continue
+                return True
+        return False
+
+    @classmethod
+    def from_config(cls, config: Config) -> Self:
+        return cls(
+            target=NetworkAddress.from_config(config),
+            payload=bytes.fromhex(config.get_str("payload", fallback="")),
+            interval=config.get_float("interval", fallback=0.5),
+        )
+
+
+class PingProbe(Probe):
+    """
+    Target is ready when it replies to ICMP echo request (sent every `interval`).
+    """
+
+    def __init__(self, host: str, interval: float):
+        self._host = host
+        self._interval = interval
+
+    def wait(self, timeout: float) -> bool:
+        args = [
+            "ping",
+            "-c",
+            "1",
+            "-i",
+            str(self._interval),
+            "-w",
+            str(max(1, math.ceil(timeout))),
+            self._host,
+        ]
+        try:
+            result = subprocess.run(
+                args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        except OSError as ex:
+            logger.error(f"Ping probe error: {ex}")
+            return False
+        return result.returncode == 0
+
+    @classmethod
+    def from_config(cls, config: Config) -> Self:
+        return cls(
+            host=config.get_str("host"),
+            interval=config.get_float("interval", fallback=1),
+        )
+
+
+def probe_from_config(config: Config, context: Context) -> Probe:
+    probe_type = config.get_str("type")
+    match probe_type:
+        case "log":
+            return LogProbe.from_config(config, context)
+        case "udp":
+            return UdpProbe.from_config(config)
+        case "ping":
+            return PingProbe.from_config(config)
+        case _:
+            raise ValueError(f"Unknown probe type '{probe_type}'")
@@ -7,20 +7,28 @@ Module representing experiment results.
 """
 
 import sys
+import threading
 from collections import defaultdict
 from datetime import datetime
 from enum import StrEnum
-from typing import Any, Collection, Mapping
+from typing import Any, Callable, Collection, Mapping
 
 from ..case.instance import CaseId
 from ..config import Config
 from ..version import VERSION
-from .values import Value
+from .values import TypedValue, Value, ValuePoint
+
+type CaseRecord = dict[str, Any]
 
 
 class SubTaskResults:
 
-    def __init__(self, results_names: list[str], success: str) -> None:
+    def __init__(
+        self,
+        results_names: list[str],
+        success: str,
+        observer: Callable[[CaseId, str], None] | None = None,
+    ) -> None:
         self.subtasks: dict[str, list[str]] = {}
         for result in results_names:
             self.subtasks[result] = []
@@ -30,11 +38,19 @@ class SubTaskResults:
         self.failed_cases: dict[str, str] = {}
         self.failed_groups: dict[str, list[str]] = defaultdict(list)
 
+        self._observer = observer
+        self._lock = (
+            threading.Lock()
+        )  # cases can be executed in parallel on many targets
+
     def collect(self, case_id: CaseId, result: str) -> None:
-        self.subtasks[result].append(case_id.unique)
-        if result != self.success:
-            self.failed_cases[case_id.unique] = result
-            self.failed_groups[case_id.group].append(case_id.unique)
+        with self._lock:
+            self.subtasks[result].append(case_id.unique)
+            if result != self.success:
+                self.failed_cases[case_id.unique] = result
+                self.failed_groups[case_id.group].append(case_id.unique)
+        if self._observer is not None:
+            self._observer(case_id, result)
 
     def total(self) -> int:
         return sum(len(v) for v in self.subtasks.values())
@@ -55,23 +71,31 @@ class SubTaskResults:
         return self.failed_groups
 
 
-class Results:
+class Results:  # pylint: disable=too-many-instance-attributes
 
     def __init__(self, config: Config):
         self.subtasks: dict[str, SubTaskResults] = {}
         self.values: dict[str, Value] = {}
         self.cases: list[str] = []
+        self.duplicates: dict[str, str] = {}  # skipped case -> case executed instead
         self.groups: set[str] = set()
-        self.info = {
+        self.info: dict[str, Any] = {
             "version": VERSION,
             "args": " ".join(sys.argv[1:]),
             "config": config.to_dict(),
             "start": self.__iso_timestamp(),
         }
 
+        # results of cases still in progress, passed to listeners when finished
+        self._records: dict[str, CaseRecord] = {}
+        self._records_lock = threading.Lock()
+        self._case_listeners: list[Callable[[CaseRecord], None]] = []
+
     def register_subtask(self, name: str, results: type[StrEnum]) -> SubTaskResults:
         r = list(str(item) for item in results)
-        s = SubTaskResults(r, r[0])
+        s = SubTaskResults(
+            r, r[0], lambda case_id, result: self._record(case_id, name, result)
+        )
         if name in self.subtasks:
             raise RuntimeError(
                 f"Subtask results already registered: '{name}'. Probably duplicated name."
@@ -84,18 +108,70 @@ class Results:
             raise RuntimeError(
                 f"Value results already registered: '{name}'. Probably duplicated name."
             )
+        value.observe(lambda point: self._record_value(point, name))
         self.values[name] = value
         return value
 
     def add_case(self, case_id: CaseId) -> None:
         self.cases.append(case_id.unique)
         self.groups.add(case_id.group)
+        with self._records_lock:
+            self._records[case_id.unique] = {
+                "id": case_id.unique,
+                "group": case_id.group,
+                "iteration": case_id.iteration,
+                "subtasks": {},
+                "values": {},
+            }
+
+    def add_duplicate(self, case_id: CaseId, executed: CaseId) -> None:
+        self.duplicates[case_id.unique] = executed.unique
+
+    def add_case_listener(self, listener: Callable[[CaseRecord], None]) -> None:
+        self._case_listeners.append(listener)
+
+    def finish_case(self, case_id: CaseId) -> None:
+        with self._records_lock:
+            record = self._records.pop(case_id.unique)
+        for listener in self._case_listeners:
+            listener(record)
+
+    def restore_case(self, record: CaseRecord) -> None:
+        """
+        Restores results of the case finished previously (see `finish_case`).
+        """
+        case_id = CaseId(record["id"], record["group"], record["iteration"])
+        self.add_case(case_id)
+        for name, result in record["subtasks"].items():
+            if name not in self.subtasks:
+                raise RuntimeError(f"Cannot restore unknown subtask results: '{name}'")
+            self.subtasks[name].collect(case_id, result)
+        for name, points in record["values"].items():
+            value = self.values.get(name)
+            if not isinstance(value, TypedValue):
+                raise RuntimeError(f"Cannot restore value: '{name}'")
+            for point in points:
+                value.collect(case_id, point)
+        with self._records_lock:
+            del self._records[case_id.unique]
+
+    def _record(self, case_id: CaseId, name: str, result: str) -> None:
+        with self._records_lock:
+            if record := self._records.get(case_id.unique):
+                record["subtasks"][name] = result
+
+    def _record_value(self, point: ValuePoint, name: str) -> None:
+        with self._records_lock:
+            if record := self._records.get(point.case_id.unique):
+                record["values"].setdefault(name, []).append(point.to_dict()["value"])
 
     def finish(self) -> None:
         self.info["end"] = self.__iso_timestamp()
 
     def summary(self) -> str:
         header = f"Processed: {len(self.cases)}\n"
+        if self.duplicates:
+            header += f"Duplicates skipped: {len(self.duplicates)}\n"
         header += f"Groups: {len(self.groups)}\n"
         return header + "\n".join(
             f"{k} ({v.total_errors()}/{v.total()}):\n{v.summary()}"
@@ -125,6 +201,7 @@ class Results:
             "cases": {
                 "all": self.cases,
                 "failed": self.failed_cases(),
+                "duplicates": self.duplicates,
             },
             "groups": {
                 "all": list(self.groups),
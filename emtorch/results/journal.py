@@ -0,0 +1,79 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module representing journal of finished cases - allows resuming interrupted experiment.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Self, TextIO
+
+from . import CaseRecord
+
+logger = logging.getLogger(__name__)
+
+
+class Journal:
+    """
+    Append-only file with one JSON line per finished case, synced to the disk
+    before the next case is started.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._file: TextIO | None = None
+        self._lock = threading.Lock()  # cases can be finished on many targets
+
+    def append(self, record: CaseRecord) -> None:
+        assert self._file is not None
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def __enter__(self) -> Self:
+        complete = self._ends_with_newline(self._path)
+        self._file = self._path.open("a", encoding="utf-8")
+        if not complete:
+            self._file.write("\n")  # last record was not written completely
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        assert self._file is not None
+        self._file.close()
+        self._file = None
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        if not path.exists() or path.stat().st_size == 0:
+            return True
+        with path.open("rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    @staticmethod
+    def read(path: Path) -> list[CaseRecord]:
+        if not path.exists():
+            return []
+        records = []
+        with path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping incomplete record {path}:{number}")
+        return records
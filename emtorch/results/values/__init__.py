@@ -8,6 +8,7 @@ Module representing gathered values gathered to be included in the results.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Callable
 
 from ...case.instance import CaseId
 
@@ -33,10 +34,13 @@ class TypedValuePoint[T: (int | float)](ValuePoint):
         }
 
 
-# pylint: disable=too-few-public-methods
 class Value:
     def __init__(self) -> None:
         self._values: list[ValuePoint] = []
+        self._observer: Callable[[ValuePoint], None] | None = None
+
+    def observe(self, observer: Callable[[ValuePoint], None]) -> None:
+        self._observer = observer
 
     def to_dict(self) -> dict[str, list[dict[str, str | int | float]]]:
         return {"points": [v.to_dict() for v in self._values]}
@@ -44,4 +48,7 @@ class Value:
 
 class TypedValue[T: (int | float)](Value):
     def collect(self, case_id: CaseId, value: T) -> None:
-        self._values.append(TypedValuePoint[T](case_id, value))
+        point = TypedValuePoint[T](case_id, value)
+        self._values.append(point)
+        if self._observer is not None:
+            self._observer(point)
@@ -6,7 +6,7 @@
 Module representing value collector.
 """
 
-from typing import Self
+from typing import Self, cast
 
 from ...case.instance import CaseId
 from ...context import Context
@@ -32,6 +32,5 @@ class Collector[T: (int | float)]:
 
     @classmethod
     def create(cls, name: str, context: Context) -> Self:
-        value = TypedValue[T]()
-        context.results.register_value(name, value)
-        return cls(value)
+        value = context.register_value(name, TypedValue[T]())
+        return cls(cast(TypedValue[T], value))
@@ -7,7 +7,6 @@ SSH command invoker.
 """
 
 import logging
-import time
 from signal import Signals
 from typing import Optional
 
@@ -81,16 +80,12 @@ class Invoker:
     def wait_for_exit(self, timeout: float) -> int:
         assert self.__handle is not None
 
-        # NOTE: paramiko ignores timeouts set with channel.settimeout() when waiting for exit
-        t0 = time.time()
-        time_elapsed = 0.0
-        while time_elapsed < timeout:
-            if self.__stdout().channel.exit_status_ready():
-                self.running = False
-                return self.__stdout().channel.recv_exit_status()
-
-            time.sleep(0.05)
-            time_elapsed = time.time() - t0
+        # NOTE: paramiko ignores timeouts set with channel.settimeout() when waiting for exit,
+        # but sets status event when exit status is received (or channel closed)
+        channel = self.__stdout().channel
+        if channel.status_event.wait(timeout):
+            self.running = False
+            return channel.recv_exit_status()
 
         logger.warning(f"{self.name}: timeout")
         raise TimeoutError(f"Timeout, {self.__pid}")
@@ -116,9 +111,7 @@ class Invoker:
                 kill_command = f"kill {self.__pid}"
                 logger.info(f"{self.name}: Killing remotely: '{kill_command}'")
                 _, stdout, _ = self.__handle.exec_command(kill_command)
-                while not stdout.channel.exit_status_ready():
-                    # Loop until command executes
-                    time.sleep(0.05)
+                stdout.channel.status_event.wait()  # until command executes
                 logger.info(f"{self.name}: Kill done")
 
             self.__handle.close()
@@ -8,7 +8,6 @@ SSH connection reader.
 
 import logging
 import threading
-import time
 from typing import Callable
 
 import paramiko
@@ -83,13 +82,12 @@ class Reader:
     ) -> None:
         while not self.kill.is_set():
             try:
-                line = stream.readline()
+                line = stream.readline()  # blocks until line is received
             except ValueError:
-                continue
-            if line:
-                line_handler(line.rstrip())
-                if not self.started_event.is_set() and line.startswith(self.start_key):
-                    self.logger.info("start key detected, marking as started")
-                    self.started_event.set()
-            else:
-                time.sleep(0.01)
+                return  # stream closed
+            if not line:
+                return  # end of stream, nothing more to be read
+            line_handler(line.rstrip())
+            if not self.started_event.is_set() and line.startswith(self.start_key):
+                self.logger.info("start key detected, marking as started")
+                self.started_event.set()
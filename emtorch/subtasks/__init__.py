@@ -7,21 +7,27 @@ Module holding experiment building blocks - sub tasks.
 """
 
 import logging
+import queue
+import threading
 from contextlib import contextmanager
-from typing import Iterator, Self
+from typing import Collection, Iterator, Self
 
 from ..config import Config
 from ..context import CaseContext, Context
-from ..results import Results, SubTaskResults
+from ..results import SubTaskResults
 from .subtask import SubTask
 
 logger = logging.getLogger(__name__)
 
 
+def subtask_name(name: str, context: Context, *prefix: str) -> str:
+    return context.qualify(".".join(prefix) + "." + name)
+
+
 # pylint: disable=too-many-return-statements,too-many-locals
 def subtask_from_config(config: Config, context: Context, *prefix: str) -> SubTask:
     task_type = config.get_str("type")
-    name = ".".join(prefix) + "." + config.get_str("name")
+    name = subtask_name(config.get_str("name"), context, *prefix)
     args = config.section("args")
     match task_type:
         case "subprocess":
@@ -29,14 +35,21 @@ def subtask_from_config(config: Config, context: Context, *prefix: str) -> SubTa
             from .subprocess import Subprocess
 
             return Subprocess.from_config(name, args, context)
+        case "subprocess_server":
+            # pylint: disable=import-outside-toplevel
+            from .server import SubprocessServer
+
+            return SubprocessServer.from_config(name, args, context)
         case "ping_stable":
-            from .ping import PingIsStable  # pylint: disable=import-outside-toplevel
+            # pylint: disable=import-outside-toplevel
+            from .ping import ping_stable_from_config
 
-            return PingIsStable.from_config(name, args, context)
+            return ping_stable_from_config(name, args, context)
         case "ping_alive":
-            from .ping import PingIsAlive  # pylint: disable=import-outside-toplevel
+            # pylint: disable=import-outside-toplevel
+            from .ping import ping_alive_from_config
 
-            return PingIsAlive.from_config(name, args, context)
+            return ping_alive_from_config(name, args, context)
         case "remote":
             from .remote import Remote  # pylint: disable=import-outside-toplevel
 
@@ -73,15 +86,35 @@ def subtask_from_config(config: Config, context: Context, *prefix: str) -> SubTa
 
 
 class SubTaskExecution:
-    def __init__(self, task: SubTask, results: SubTaskResults):
+    def __init__(
+        self,
+        task: SubTask,
+        results: SubTaskResults,
+        after: Collection[str],
+        host_only: bool = False,
+    ):
         self._task = task
         self._results = results
+        self._after = frozenset(after)
+        self._host_only = host_only
         self._start_result: SubTask.StartResult | None = None
 
     @property
     def name(self) -> str:
         return self._task.name
 
+    @property
+    def after(self) -> frozenset[str]:
+        return self._after
+
+    @after.setter
+    def after(self, after: Collection[str]) -> None:
+        self._after = frozenset(after)
+
+    @property
+    def host_only(self) -> bool:
+        return self._host_only
+
     def start(self, context: CaseContext) -> None:
         self._start_result = self._task.start(context)
 
@@ -101,8 +134,8 @@ class SubTaskExecution:
 
 
 class SubTasks:
-    def __init__(self, results: Results, *prefix: str):
-        self._results = results
+    def __init__(self, context: Context, *prefix: str):
+        self._context = context
         self._prefix = prefix
         self._tasks: list[SubTaskExecution] = []
 
@@ -110,21 +143,117 @@ class SubTasks:
     def name(self) -> str:
         return ".".join(self._prefix)
 
-    def register(self, task: SubTask) -> None:
+    def register(
+        self,
+        task: SubTask,
+        after: Collection[str] | None = None,
+        host_only: bool = False,
+    ) -> None:
+        """
+        Registers task executed after `after` tasks (by default: previously registered).
+        """
+        if after is None:
+            after = [self._tasks[-1].name] if self._tasks else []
+        known = {t.name for t in self._tasks}
+        for dependency in after:
+            if dependency not in known:
+                raise ValueError(
+                    f"Unknown dependency <{dependency}> of <{task.name}> "
+                    "(only tasks defined earlier can be used)"
+                )
         logger.info(f"Registering <{task.name}>")
         execution = SubTaskExecution(
             task,
-            self._results.register_subtask(task.name, task.result_type),
+            self._context.register_subtask(task.name, task.result_type),
+            after,
+            host_only,
         )
         self._tasks.append(execution)
 
+    def partition(self) -> tuple[Self, Self]:
+        """
+        Splits tasks into the ones involving the target and the host-only ones.
+        Tasks depending on host-only tasks will depend on their dependencies instead.
+        """
+        host_only = {t.name: t for t in self._tasks if t.host_only}
+
+        def resolve(after: Collection[str]) -> set[str]:
+            result: set[str] = set()
+            for name in after:
+                result |= (
+                    resolve(host_only[name].after) if name in host_only else {name}
+                )
+            return result
+
+        target = self.__class__(self._context, *self._prefix)
+        host = self.__class__(self._context, *self._prefix)
+        for task in self._tasks:
+            if not task.host_only:
+                task.after = resolve(task.after)
+            # pylint: disable=protected-access
+            (host if task.host_only else target)._tasks.append(task)
+        return target, host
+
+    def __bool__(self) -> bool:
+        return bool(self._tasks)
+
     def execute_for(self, context: CaseContext) -> None:
+        """
+        Executes tasks as soon as all tasks they depend on are finished.
+        Tasks ready at the same time are finished concurrently.
+        """
         logger.info(f"Start {self.name}")
-        for task in self._tasks:
-            logger.info(f"Executing {task.name}")
-            task.execute_for(context)
+        pending = list(self._tasks)
+        # dependencies from outside of this group were executed before
+        done = set().union(*(t.after for t in pending)) - {t.name for t in pending}
+        finished: queue.Queue[tuple[SubTaskExecution, BaseException | None]] = (
+            queue.Queue()
+        )
+        running = 0
+        error: BaseException | None = None
+
+        while (pending and error is None) or running:
+            ready = [t for t in pending if t.after <= done] if error is None else []
+            for task in ready:
+                pending.remove(task)
+                logger.info(f"Executing {task.name}")
+                task.start(context)
+
+            if running == 0 and len(ready) == 1:
+                ready[0].finish_for(context)  # nothing to wait for concurrently
+                done.add(ready[0].name)
+                continue
+
+            for task in ready:
+                threading.Thread(
+                    name=task.name,
+                    target=self._finish_concurrently,
+                    args=(task, context, finished),
+                ).start()
+            running += len(ready)
+
+            assert running > 0
+            task, task_error = finished.get()
+            running -= 1
+            done.add(task.name)
+            error = error if error is not None else task_error
+
+        if error is not None:
+            raise error
         logger.info(f"End {self.name}")
 
+    @staticmethod
+    def _finish_concurrently(
+        task: SubTaskExecution,
+        context: CaseContext,
+        finished: queue.Queue[tuple[SubTaskExecution, BaseException | None]],
+    ) -> None:
+        try:
+            task.finish_for(context)
+            finished.put((task, None))
+        except BaseException as ex:  # pylint: disable=broad-exception-caught
+            finished.put((task, ex))
+
     @contextmanager
     def monitor(self, context: CaseContext) -> Iterator[None]:
         try:
@@ -149,7 +278,14 @@ class SubTasks:
 
     @classmethod
     def from_config(cls, *prefix: str, context: Context) -> Self:
-        tasks = cls(context.results, *prefix)
+        tasks = cls(context, *prefix)
+        previous: list[str] = []
         for conf in context.config_root.get_config_list(*prefix):
-            tasks.register(subtask_from_config(conf, context, *prefix))
+            after = conf.get_str_list("after", fallback=previous)
+            tasks.register(
+                subtask_from_config(conf, context, *prefix),
+                [subtask_name(n, context, *prefix) for n in after],
+                conf.get_bool("host_only", fallback=False),
+            )
+            previous = [conf.get_str("name")]
         return tasks
@@ -69,7 +69,7 @@ class LoggerMatcher[T: (int | float)](BasicSubTask):
             name=name,
             collector=Collector[T].create(config.get_str("value"), context),
             pattern=config.get_str("pattern"),
-            subtask=config.get_str("subtask"),
+            subtask=context.qualify(config.get_str("subtask")),
         )
 
 
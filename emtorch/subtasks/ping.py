@@ -7,55 +7,81 @@ Module holding sub-tasks related to network "ping".
 """
 
 import logging
+import re
+import statistics
 import subprocess
-from typing import IO, Self
+import threading
+from typing import IO, Optional, Self, cast
 
+from ..case.instance import CaseId
 from ..config import Config
 from ..context import CaseContext, Context
-from ..io import IOLoop
-from ..io.streams import InputStream
-from .subprocess import FinishConfig, Subprocess
+from ..io import IOLoop, Timer
+from ..io.sockets import IcmpEchoSocket
+from ..io.streams import DEFAULT_READ_SIZE, StreamLogger
+from ..results.values import TypedValue
+from .subprocess import FinishConfig, ResourceUsage, Spawner, Subprocess
+from .subtask import BasicSubTask
 
 logger = logging.getLogger(__name__)
 
 
-class PingIsAliveStream(InputStream):
-    def __init__(self, name: str, stream: IO[bytes], process: subprocess.Popen[bytes]):
-        super().__init__(name, stream)
+class PingIsAliveStream(StreamLogger):
+    """
+    Parses output of flood ping: header line, then `.` for each request sent,
+    backspace for each reply received and `E` for each error. All available
+    output is parsed at once, runs of requests sent without reply together.
+    The process is terminated when request is sent after the reply.
+    """
+
+    _EVENTS = re.compile(rb"\x08|\.+|E")
+
+    def __init__(
+        self,
+        name: str,
+        stream: IO[bytes],
+        process: subprocess.Popen[bytes],
+        read_size: int = DEFAULT_READ_SIZE,
+    ):
+        super().__init__(name, "STDOUT", stream, read_size)
 
-        self.header = b""
         self.header_done = False
         self.response_received = False
+        self.terminated = False
 
         self.process = process
 
-    def read(self) -> None:
-        char = self.stream.read(1)
-        if len(char) == 0:
-            self.mark_eof()
-            return
-        if self.header_done:
-            match char:
-                case b"\b":
-                    if not self.response_received:
-                        self.logger.info("Response received")
-                    self.response_received = True
-                case b".":
-                    if self.response_received:
-                        self.logger.info("Ping received")
-                        # if process finishes before external timeout - it will be a success
-                        self.process.terminate()
-                    else:
-                        self.logger.info("Ping")
-                case b"E":
-                    self.logger.warning("Error response")
-                    self.response_received = False
-        else:
-            if char == b"\n":
-                self.logger.info(f"{self.header!r}")
-                self.header_done = True
-            else:
-                self.header += char
+    def _split(self, data: bytes) -> None:
+        if not self.header_done:
+            header, newline, data = data.partition(b"\n")
+            self._buffer += header
+            if not newline:
+                return
+            self.header_done = True
+            self._log(self._buffer)
+            self._buffer.clear()
+        for event in self._EVENTS.finditer(data):
+            self._handle(event[0])
+
+    def _handle(self, event: bytes) -> None:
+        match event[:1]:
+            case b"\x08":
+                if not self.response_received:
+                    self.logger.info("Response received")
+                self.response_received = True
+            case b".":
+                if not self.response_received:
+                    self.logger.info(
+                        "Ping" if len(event) == 1 else f"Ping x{len(event)}"
+                    )
+                elif not self.terminated:
+                    self.logger.info("Ping received")
+                    # if process finishes before external timeout - it will be a success
+                    self.process.terminate()
+                    self.terminated = True
+            case b"E":
+                self.logger.warning("Error response")
+                self.response_received = False
 
 
 class PingIsAlive(Subprocess):
@@ -64,7 +90,16 @@ class PingIsAlive(Subprocess):
     """
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
-    def __init__(self, name: str, host: str, interval: int, timeout: float, io: IOLoop):
+    def __init__(
+        self,
+        name: str,
+        host: str,
+        interval: int,
+        timeout: float,
+        io: IOLoop,
+        spawner: Spawner | None = None,
+        usage: ResourceUsage | None = None,
+    ):
 
         super().__init__(
             name=name,
@@ -80,6 +115,8 @@ class PingIsAlive(Subprocess):
             io=io,
             check_exit_code=False,
             subtask_logger=logger,
+            spawner=spawner,
+            usage=usage,
         )
 
         self.stream: PingIsAliveStream | None = None
@@ -91,7 +128,9 @@ class PingIsAlive(Subprocess):
         assert self.process is not None
         assert self.process.stdout is not None
 
-        self.stream = PingIsAliveStream(self.name, self.process.stdout, self.process)
+        self.stream = PingIsAliveStream(
+            self.name, self.process.stdout, self.process, self.read_size
+        )
         self.io.register(self.stream)  # overrides registration done by parent
 
         return True
@@ -114,6 +153,8 @@ class PingIsAlive(Subprocess):
             timeout=config.get_float("timeout"),
             interval=config.get_int("interval"),
             io=context.worker(IOLoop),
+            spawner=context.worker(Spawner),
+            usage=ResourceUsage.register(name, context),
         )
 
 
@@ -123,7 +164,16 @@ class PingIsStable(Subprocess):
     """
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
-    def __init__(self, name: str, host: str, count: int, interval: int, io: IOLoop):
+    def __init__(
+        self,
+        name: str,
+        host: str,
+        count: int,
+        interval: int,
+        io: IOLoop,
+        spawner: Spawner | None = None,
+        usage: ResourceUsage | None = None,
+    ):
         timeout = (count + 1) * interval
         super().__init__(
             name=name,
@@ -141,6 +191,8 @@ class PingIsStable(Subprocess):
             shell=False,
             io=io,
             subtask_logger=logger,
+            spawner=spawner,
+            usage=usage,
         )
 
     @classmethod
@@ -151,4 +203,145 @@ class PingIsStable(Subprocess):
             count=config.get_int("count"),
             interval=config.get_int("interval"),
             io=context.worker(IOLoop),
+            spawner=context.worker(Spawner),
+            usage=ResourceUsage.register(name, context),
         )
+
+
+class NativePing(BasicSubTask):  # pylint: disable=too-many-instance-attributes
+    """
+    Pings the target without `ping` process - echo requests are sent every
+    `interval` by the I/O loop through ICMP datagram socket. Without `count`
+    succeeds when any reply is received (as `ping_alive`), otherwise when all
+    `count` requests are replied (as `ping_stable`), within `timeout`.
+    Mean round trip time is stored in the `rtt` value.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        name: str,
+        host: str,
+        interval: float,
+        timeout: float,
+        io: IOLoop,
+        count: Optional[int] = None,
+        rtt: TypedValue[float] | None = None,
+    ):
+        super().__init__(name, logger)
+
+        self.host = host
+        self.interval = interval
+        self.timeout = timeout
+        self.io = io
+        self.count = count
+        self.rtt = rtt
+
+        self._lock = threading.Lock()
+        self._socket: IcmpEchoSocket | None = None
+        self._timer: Timer | None = None
+        self._sent = 0
+        self._rtts: list[float] = []
+        self._replied = threading.Event()
+        self._case_id: CaseId | None = None
+
+    def basic_start(self, context: CaseContext) -> bool:
+        self._case_id = context.case.identifier
+        self._sent = 0
+        self._rtts = []
+        self._replied.clear()
+        try:
+            icmp = IcmpEchoSocket(self.name, self.host, self._on_reply)
+        except OSError as ex:
+            self.logger.error(f"Operation error: {ex}")
+            return False
+        with self._lock:
+            self._socket = icmp
+            self.io.register(icmp)
+            self._timer = self.io.call_later(0, self._send)
+        return True
+
+    def finish(self) -> BasicSubTask.Result:
+        replied = self._replied.wait(self.timeout)
+        with self._lock:
+            assert self._socket is not None
+            if self._timer is not None:
+                self._timer.cancel()
+            self.io.close(self._socket)
+            self._socket = None
+            rtts = list(self._rtts)
+
+        if rtts and self.rtt is not None:
+            assert self._case_id is not None
+            self.rtt.collect(self._case_id, statistics.fmean(rtts))
+        if not replied:
+            self.logger.warning(f"Received {len(rtts)} of {self._sent} replies")
+            return self.Result.FAILURE
+        self.logger.info(f"Received {len(rtts)} replies")
+        return self.Result.SUCCESS
+
+    def _send(self) -> None:
+        # called by the I/O thread
+        with self._lock:
+            if self._socket is None:
+                return  # already finished
+            sequence = self._socket.send()
+            self._sent += 1
+            if sequence is not None:
+                self.logger.debug(f"Echo request {sequence}")
+            if self.count is None or self._sent < self.count:
+                self._timer = self.io.call_later(self.interval, self._send)
+
+    def _on_reply(self, sequence: int, rtt: float) -> None:
+        self.logger.info(f"Reply {sequence}: {rtt * 1000:.3f}ms")
+        with self._lock:
+            self._rtts.append(rtt)
+            if len(self._rtts) >= (self.count or 1):
+                self._replied.set()
+
+    @classmethod
+    def alive_from_config(cls, name: str, config: Config, context: Context) -> Self:
+        return cls(
+            name=name,
+            host=config.get_str("host"),
+            interval=config.get_float("interval"),
+            timeout=config.get_float("timeout"),
+            io=context.worker(IOLoop),
+            rtt=cls._register_rtt(name, context),
+        )
+
+    @classmethod
+    def stable_from_config(cls, name: str, config: Config, context: Context) -> Self:
+        count = config.get_int("count")
+        interval = config.get_float("interval")
+        return cls(
+            name=name,
+            host=config.get_str("host"),
+            interval=interval,
+            timeout=(count + 1) * interval,
+            io=context.worker(IOLoop),
+            count=count,
+            rtt=cls._register_rtt(name, context),
+        )
+
+    @staticmethod
+    def _register_rtt(name: str, context: Context) -> TypedValue[float]:
+        name = name.removesuffix(context.qualify(""))  # values shared between targets
+        return cast(
+            TypedValue[float],
+            context.register_value(f"{name}.rtt", TypedValue[float]()),
+        )
+
+
+def ping_alive_from_config(name: str, config: Config, context: Context) -> BasicSubTask:
+    if config.get_bool("native", fallback=False):
+        return NativePing.alive_from_config(name, config, context)
+    return PingIsAlive.from_config(name, config, context)
+
+
+def ping_stable_from_config(
+    name: str, config: Config, context: Context
+) -> BasicSubTask:
+    if config.get_bool("native", fallback=False):
+        return NativePing.stable_from_config(name, config, context)
+    return PingIsStable.from_config(name, config, context)
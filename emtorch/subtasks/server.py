@@ -0,0 +1,246 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+Module providing sub task handling cases by long-lived (server) process.
+"""
+
+import base64
+import json
+import logging
+import queue
+import subprocess
+import time
+from signal import Signals
+from typing import IO, Any, Optional, Self, cast
+
+from ..case.instance import CaseId
+from ..config import Config
+from ..context import CaseContext, Context
+from ..io import IOLoop
+from ..io.process import ProcessGroup
+from ..io.streams import DEFAULT_READ_SIZE, StreamLogger
+from ..results.values import TypedValue
+from .subprocess import Spawner
+from .subtask import BasicSubTask
+
+logger = logging.getLogger(__name__)
+
+type Response = dict[str, Any]
+
+
+class ResponseReader(StreamLogger):
+    """
+    Logs output of the server, passing JSON objects (responses) to the queue.
+    None is passed when the output is closed (server exited).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stream: IO[bytes],
+        responses: queue.Queue[Response | None],
+        read_size: int,
+    ):
+        super().__init__(name, "STDOUT", stream, read_size)
+        self._responses = responses
+
+    def _log(self, line: bytes | bytearray) -> None:
+        super()._log(line)
+        if line.lstrip().startswith(b"{"):
+            try:
+                response = json.loads(line)
+            except ValueError:
+                return
+            if isinstance(response, dict):
+                self._responses.put(response)
+
+    def mark_eof(self) -> None:
+        super().mark_eof()
+        self._responses.put(None)
+
+
+# pylint: disable=too-many-instance-attributes
+class SubprocessServer(BasicSubTask):
+    """
+    Sends each case as a request (JSON line) to the standard input of the process
+    started once (restarted when it exits, fails to respond in time or handled
+    `restart_after` cases) and waits for the response (JSON line) on its output.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        name: str,
+        args: list[str],
+        shell: bool,
+        timeout: float,
+        io: IOLoop,
+        restart_after: int = 0,
+        inline: bool = False,
+        values: dict[str, TypedValue[float]] | None = None,
+        read_size: int = DEFAULT_READ_SIZE,
+        spawner: Spawner | None = None,
+    ):
+        super().__init__(name, logger)
+
+        self.args = args
+        self.shell = shell
+        self.timeout = timeout
+        self.io = io
+        self.restart_after = restart_after
+        self.inline = inline
+        self.values = values if values is not None else {}
+        self.read_size = read_size
+        self.spawner = spawner if spawner is not None else Spawner()
+
+        self.process: Optional[subprocess.Popen[bytes]] = None
+        self._responses: queue.Queue[Response | None] = queue.Queue()
+        self._served = 0
+        self._case_id: CaseId | None = None
+
+    def basic_start(self, context: CaseContext) -> bool:
+        try:
+            self._ensure_started()
+            assert self.process is not None and self.process.stdin is not None
+            self._case_id = context.case.identifier
+            self.process.stdin.write(self._request(context) + b"\n")
+            self.process.stdin.flush()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.logger.error(f"Operation error: {ex}")
+            return False
+        return True
+
+    def finish(self) -> BasicSubTask.Result:
+        assert self._case_id is not None
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                response = self._responses.get(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except queue.Empty:
+                self.logger.warning("Operation timeout, killing the server")
+                self._stop_process(kill=True)
+                return self.Result.TIMEOUT
+            if response is None:
+                self.logger.error("Server exited without response")
+                self._stop_process(kill=True)
+                return self.Result.ERROR
+            if response.get("id") == self._case_id.unique:
+                break
+            self.logger.warning(f"Ignoring response to {response.get('id')}")
+
+        self._served += 1
+        self._collect_values(response)
+        match response.get("result"):
+            case "success":
+                return self.Result.SUCCESS
+            case "failure":
+                self.logger.warning("Operation reported as failed")
+                return self.Result.FAILURE
+            case result:
+                self.logger.error(f"Invalid result: {result!r}")
+                return self.Result.ERROR
+
+    def shutdown(self) -> None:
+        if self.process is not None:
+            self._stop_process()
+
+    def _request(self, context: CaseContext) -> bytes:
+        case_id = context.case.identifier
+        request: dict[str, str | int] = {
+            "id": case_id.unique,
+            "group": case_id.group,
+            "iteration": case_id.iteration,
+        }
+        if self.inline:
+            request["data"] = base64.b64encode(context.case.data.contents).decode()
+        else:
+            request["path"] = str(context.case.data.path)
+        return json.dumps(request).encode()
+
+    def _collect_values(self, response: Response) -> None:
+        assert self._case_id is not None
+        for name, value in response.get("values", {}).items():
+            if name not in self.values or not isinstance(value, (int, float)):
+                self.logger.warning(f"Unexpected value {name}: {value!r}")
+                continue
+            self.values[name].collect(self._case_id, value)
+
+    def _ensure_started(self) -> None:
+        if self.process is not None:
+            if self.process.poll() is not None:
+                self.logger.warning(f"Server exited ({self.process.returncode})")
+            elif 0 < self.restart_after <= self._served:
+                self.logger.info(f"Restarting server after {self._served} cases")
+            else:
+                return
+            self._stop_process()
+
+        self.logger.info(f"Starting server {self.args}")
+        self.process = self.spawner.spawn(self.args, self.shell)
+        assert self.process.stdout is not None
+        assert self.process.stderr is not None
+        self._responses = queue.Queue()
+        self._served = 0
+        self.io.register(
+            ResponseReader(
+                self.name, self.process.stdout, self._responses, self.read_size
+            )
+        )
+        self.io.register(
+            StreamLogger(self.name, "STDERR", self.process.stderr, self.read_size)
+        )
+
+    def _stop_process(self, kill: bool = False) -> None:
+        assert self.process is not None
+        assert self.process.stdin is not None
+        assert self.process.stdout is not None
+        assert self.process.stderr is not None
+
+        group = ProcessGroup(self.process.pid)
+        if kill:
+            group.signal(Signals.SIGKILL)
+        try:
+            self.process.stdin.close()  # end of requests
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            self.logger.warning("Server not finished after end of requests, killing")
+            group.signal(Signals.SIGKILL)
+            self.process.wait()
+        self.logger.info(f"Server finished ({self.process.returncode})")
+        if group.members():
+            self.logger.warning("Processes left after the server, stopping")
+            group.stop()
+
+        self.io.close(self.process.stdout)
+        self.io.close(self.process.stderr, block=True)
+        self.process = None
+
+    @classmethod
+    def from_config(cls, name: str, config: Config, context: Context) -> Self:
+        values = {
+            value: cast(
+                TypedValue[float], context.register_value(value, TypedValue[float]())
+            )
+            for value in config.get_str_list("values", fallback=[])
+        }
+        result = cls(
+            name=name,
+            args=config.get_str_list("cmd"),
+            shell=config.get_bool("shell", fallback=False),
+            timeout=config.get_float("timeout"),
+            io=context.worker(IOLoop),
+            restart_after=config.get_int("restart_after", fallback=0),
+            inline=config.get_str("payload", fallback="path") == "inline",
+            values=values,
+            read_size=config.get_int("read_size", fallback=DEFAULT_READ_SIZE),
+            spawner=context.worker(Spawner),
+        )
+        context.add_cleanup(result.shutdown)
+        return result
@@ -7,25 +7,134 @@ Module providing subprocess based sub tasks.
 """
 
 import logging
+import resource
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from signal import Signals
-from typing import Optional, Self
+from typing import Any, Optional, Self, cast
 
+from ..case.instance import CaseId
 from ..config import Config
-from ..context import CaseContext, Context
+from ..context import CaseContext, Context, Worker
 from ..context.template import Template
 from ..io import IOLoop
-from ..io.streams import StreamLogger
+from ..io.process import DEFAULT_KILL_GRACE, ProcessGroup, ProcessWatch
+from ..io.streams import DEFAULT_READ_SIZE, StreamLogger, StreamWriter
+from ..results.values import TypedValue
 from .subtask import BasicSubTask
 
 logger = logging.getLogger(__name__)
 
 
+class Spawner(Worker):
+    """
+    Starts processes with all standard streams redirected to pipes, each in its
+    own session (process group, so all its descendants can be stopped), measuring
+    spawn latency.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spawns = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def spawn(self, args: list[str], shell: bool) -> subprocess.Popen[bytes]:
+        t0 = time.perf_counter()
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            text=False,
+            shell=shell,
+            start_new_session=True,
+        )
+        elapsed = time.perf_counter() - t0
+        with self._lock:
+            self._spawns += 1
+            self._total += elapsed
+            self._max = max(self._max, elapsed)
+        return process
+
+    def report(self, info: dict[str, Any]) -> None:
+        info["spawn"] = {
+            "processes": self._spawns,
+            "total": self._total,
+            "mean": self._total / self._spawns if self._spawns else 0.0,
+            "max": self._max,
+        }
+        logger.info(
+            f"Spawned {self._spawns} processes in {self._total:.3f}s"
+            f" (max {self._max * 1000:.1f}ms)"
+        )
+
+    @classmethod
+    def from_config(cls, config: Config) -> Self:
+        return cls()
+
+
+class ResourceUsage:
+    """
+    Resource usage of the process (from `wait4`) stored as values named after
+    the subtask: `<name>.wall_time`, `<name>.user_time`, `<name>.system_time`
+    (seconds), `<name>.max_rss` (KiB), `<name>.context_switches` and
+    `<name>.leaked_processes` (left in its process group after it exited).
+    """
+
+    METRICS = (
+        "wall_time",
+        "user_time",
+        "system_time",
+        "max_rss",
+        "context_switches",
+        "leaked_processes",
+    )
+
+    def __init__(self, values: dict[str, TypedValue[float]]):
+        self.values = values
+
+    def collect(
+        self, case_id: CaseId, wall_time: float, rusage: resource.struct_rusage
+    ) -> None:
+        self.values["wall_time"].collect(case_id, wall_time)
+        self.values["user_time"].collect(case_id, rusage.ru_utime)
+        self.values["system_time"].collect(case_id, rusage.ru_stime)
+        self.values["max_rss"].collect(case_id, rusage.ru_maxrss)
+        self.values["context_switches"].collect(
+            case_id, rusage.ru_nvcsw + rusage.ru_nivcsw
+        )
+
+    def collect_leaked(self, case_id: CaseId, leaked: int) -> None:
+        self.values["leaked_processes"].collect(case_id, leaked)
+
+    @classmethod
+    def register(cls, name: str, context: Context) -> Self:
+        name = name.removesuffix(context.qualify(""))  # values shared between targets
+        return cls(
+            {
+                metric: cast(
+                    TypedValue[float],
+                    context.register_value(f"{name}.{metric}", TypedValue[float]()),
+                )
+                for metric in cls.METRICS
+            }
+        )
+
+
 @dataclass
 class FinishConfig:
     timeout: float
     signal: Optional[Signals]
+    grace: float = DEFAULT_KILL_GRACE
 
     @staticmethod
     def _signal_from_name(name: str) -> Optional[Signals]:
@@ -42,10 +151,11 @@ class FinishConfig:
         return cls(
             config.get_float("timeout"),
             cls._signal_from_name(config.get_str("signal")),
+            config.get_float("grace", fallback=DEFAULT_KILL_GRACE),
         )
 
 
-class Subprocess(BasicSubTask):
+class Subprocess(BasicSubTask):  # pylint: disable=too-many-instance-attributes
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
@@ -57,6 +167,10 @@ class Subprocess(BasicSubTask):
         io: IOLoop,
         check_exit_code: bool = True,
         subtask_logger: logging.Logger = logger,
+        read_size: int = DEFAULT_READ_SIZE,
+        stdin: bool = False,
+        spawner: Spawner | None = None,
+        usage: ResourceUsage | None = None,
     ):
         super().__init__(name, subtask_logger)
 
@@ -67,29 +181,41 @@ class Subprocess(BasicSubTask):
         self.io = io
 
         self.process: Optional[subprocess.Popen[bytes]] = None
+        self.exit_watch: Optional[ProcessWatch] = None
 
         self.check_exit_code = check_exit_code
+        self.read_size = read_size
+        self.stdin = stdin
+        self.spawner = spawner if spawner is not None else Spawner()
+        self.usage = usage
+        self._case_id: CaseId | None = None
+        self._spawned = 0.0
 
     def basic_start(self, context: CaseContext) -> bool:
         try:
             args = [arg.evaluate(context) for arg in self.args]
+            payload = context.case.data.contents if self.stdin else None
             self.logger.info(f"Starting {args}")
-            self.process = subprocess.Popen(  # pylint: disable=consider-using-with
-                args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
-                text=False,
-                shell=self.shell,
-            )
+            self._case_id = context.case.identifier
+            self._spawned = time.monotonic()
+            self.process = self.spawner.spawn(args, self.shell)
         except Exception as ex:  # pylint: disable=broad-exception-caught
             self.logger.error(f"Operation error: {ex}")
             return False
 
         assert self.process.stdout is not None
         assert self.process.stderr is not None
-        self.io.register(StreamLogger(self.name, "STDOUT", self.process.stdout))
-        self.io.register(StreamLogger(self.name, "STDERR", self.process.stderr))
+        for subname, stream in (
+            ("STDOUT", self.process.stdout),
+            ("STDERR", self.process.stderr),
+        ):
+            self.io.register(StreamLogger(self.name, subname, stream, self.read_size))
+        self.exit_watch = ProcessWatch.create(self.name, self.process)
+        if self.exit_watch is not None:
+            self.io.register(self.exit_watch)
+        if payload is not None:
+            assert self.process.stdin is not None
+            self.io.register(StreamWriter(self.name, self.process.stdin, payload))
         return True
 
     def finish(self) -> BasicSubTask.Result:
@@ -100,9 +226,12 @@ class Subprocess(BasicSubTask):
 
         result = self._finish_process()
 
-        if self.process.poll() is None:
-            self.process.terminate()
+        if self.process.poll() is not None:
+            self._collect_usage()
+        self._stop_group()
 
+        if self.exit_watch is not None:
+            self.io.close(self.exit_watch)
         self.io.close(self.process.stdin)
         self.io.close(self.process.stdout)
         self.io.close(self.process.stderr, block=True)
@@ -115,10 +244,10 @@ class Subprocess(BasicSubTask):
 
         if self.finish_config.signal:
             self.logger.info(f"Sending signal {self.finish_config.signal.name}")
-            self.process.send_signal(self.finish_config.signal)
+            ProcessGroup(self.process.pid).signal(self.finish_config.signal)
 
         try:
-            self.process.wait(timeout=self.finish_config.timeout)
+            self._wait(self.finish_config.timeout)
         except subprocess.TimeoutExpired:
             self.logger.warning("Operation timeout")
             return self.Result.TIMEOUT
@@ -138,6 +267,49 @@ class Subprocess(BasicSubTask):
         self.logger.info("Operation finished successfully")
         return self.Result.SUCCESS
 
+    def _collect_usage(self) -> None:
+        # rusage is known only when the process was reaped by the exit watch
+        if self.usage is None or self.exit_watch is None:
+            return
+        if self.exit_watch.rusage is None or self.exit_watch.exit_time is None:
+            return
+        assert self._case_id is not None
+        self.usage.collect(
+            self._case_id,
+            self.exit_watch.exit_time - self._spawned,
+            self.exit_watch.rusage,
+        )
+
+    def _stop_group(self) -> None:
+        """
+        Stops the process and its descendants left in its process group
+        (e.g. started by the shell), escalating to SIGKILL after grace period.
+        """
+        assert self.process is not None
+        group = ProcessGroup(self.process.pid)
+        running = self.process.poll() is None
+        leaked = [pid for pid in group.members() if pid != self.process.pid]
+        if leaked:
+            self.logger.warning(f"Processes left after the operation: {leaked}")
+        if running or leaked:
+            group.stop(
+                self.finish_config.signal or Signals.SIGTERM, self.finish_config.grace
+            )
+        if self.usage is not None:
+            assert self._case_id is not None
+            self.usage.collect_leaked(self._case_id, len(leaked))
+
+    def _wait(self, timeout: float) -> None:
+        """
+        Waits for exit of the process - notified by the I/O loop when possible,
+        instead of polling.
+        """
+        assert self.process is not None
+        if self.exit_watch is None:
+            self.process.wait(timeout=timeout)
+        elif not self.exit_watch.wait(timeout):
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+
     @classmethod
     def from_config(cls, name: str, config: Config, context: Context) -> Self:
         return cls(
@@ -146,4 +318,8 @@ class Subprocess(BasicSubTask):
             shell=config.get_bool("shell"),
             finish_config=FinishConfig.from_config(config.section("finish")),
             io=context.worker(IOLoop),
+            read_size=config.get_int("read_size", fallback=DEFAULT_READ_SIZE),
+            stdin=config.get_bool("stdin", fallback=False),
+            spawner=context.worker(Spawner),
+            usage=ResourceUsage.register(name, context),
         )
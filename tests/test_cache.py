@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+cache module tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from emtorch.case.cache import PayloadCache
+from emtorch.case.instance import CaseData, CaseId, CaseInstance
+from emtorch.case.prefetch import Prefetcher
+
+
+def _given_file(path: Path, size: int, value: int = 0) -> Path:
+    path.write_bytes(bytes([value]) * size)
+    return path
+
+
+def test_least_recently_used_evicted_when_released(tmp_path: Path) -> None:
+    a, b, c = (_given_file(tmp_path / n, 10) for n in "abc")
+    cache = PayloadCache(20)
+
+    for path in (a, b, a, c):
+        cache.acquire(path)
+    assert cache.size == 30  # all pinned
+
+    for path in (a, b, a, c):
+        cache.release(path)
+        path.unlink(missing_ok=True)
+    assert cache.size == 20
+
+    cache.acquire(a)
+    cache.acquire(c)
+    with pytest.raises(FileNotFoundError):
+        cache.acquire(b)
+
+
+def test_data_released_when_all_cases_finished(tmp_path: Path) -> None:
+    path = _given_file(tmp_path / "a", 10)
+    cache = PayloadCache(0)
+    data = CaseData(path, cache)
+
+    data.retain()
+    data.retain()
+    assert data.contents == bytes(10)
+    data.release()
+    assert cache.size == 10
+
+    data.release()
+    assert cache.size == 0
+
+
+def test_large_files_memory_mapped(tmp_path: Path) -> None:
+    small = _given_file(tmp_path / "small", 10)
+    large = _given_file(tmp_path / "large", 100, 1)
+    cache = PayloadCache(1000, mmap_threshold=100)
+
+    assert isinstance(cache.acquire(small), bytes)
+    payload = cache.acquire(large)
+    assert isinstance(payload, memoryview)
+    assert payload == bytes([1]) * 100
+
+
+def test_prefetched_payloads_limited_by_size(tmp_path: Path) -> None:
+    a, b, c = (_given_file(tmp_path / n, 10) for n in "abc")
+    cache = PayloadCache(1000)
+
+    for path in (a, b, c):
+        cache.prefetch(path, max_size=20)
+    for path in (a, b, c):
+        cache.acquire(path)
+
+    assert cache.stats["prefetch_hits"] == 2
+    assert cache.stats["prefetch_skipped"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_prefetcher_keeps_order(tmp_path: Path) -> None:
+    cache = PayloadCache(1000)
+    instances = [
+        CaseInstance(CaseId.from_id(n), CaseData(_given_file(tmp_path / n, 10), cache))
+        for n in "abcd"
+    ]
+
+    with Prefetcher(depth=2, max_size=1000) as prefetcher:
+        result = [i.identifier.unique for i in prefetcher.wrap(instances)]
+
+    assert result == ["a", "b", "c", "d"]
@@ -95,3 +95,28 @@ def test_repeats_handles_large_number_edge_case() -> None:
 
     assert _cases_ids(cases)[0] == "a[000]"
     assert _cases_ids(cases)[-1] == "c[999]"
+
+
+def test_directories_and_lists_expanded_in_order(tmp_path: Path) -> None:
+    for name in ("b/2", "b/1", "a", "c"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).touch()
+    listing = tmp_path / "list"
+    listing.write_text(f"{tmp_path / 'c'}\n\n{tmp_path / 'missing'}\n")
+    args = _given_data(str(tmp_path / "b"), str(tmp_path / "[a]"), f"@{listing}")
+
+    cases = CaseInstance.list_from(args)
+
+    assert _data_ids(cases) == [str(tmp_path / n) for n in ("b/1", "b/2", "a", "c")]
+
+
+def test_source_rescanned_for_each_round(tmp_path: Path) -> None:
+    for name in ("a", "b"):
+        (tmp_path / name).touch()
+    args = _given_data(str(tmp_path))
+    args.repeats = 2
+    args.repeat_mode = RepeatMode.ABAB
+
+    cases = CaseInstance.list_from(args)
+
+    assert [Path(c).name for c in _cases_ids(cases)] == ["a[0]", "b[0]", "a[1]", "b[1]"]
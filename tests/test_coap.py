@@ -0,0 +1,23 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+coap module tests.
+"""
+
+import time
+
+from emtorch.coap.validator import Validator
+from emtorch.io import IOLoop
+from emtorch.io.net import NetworkAddress
+
+
+def test_result_wait_bounded_when_message_not_sent() -> None:
+    validator = Validator(NetworkAddress("127.0.0.1", 5683), 0.1, IOLoop())
+
+    t0 = time.monotonic()
+    result = validator.wait_for_result()
+
+    assert result is Validator.Result.TIMEOUT
+    assert time.monotonic() - t0 < 2
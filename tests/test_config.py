@@ -188,3 +188,14 @@ def test_throws_when_not_bool() -> None:
         conf.get_bool("b")
     with pytest.raises(TypeError):
         conf.get_bool("sub")
+
+
+def test_returns_list_fallback_on_unknown_key() -> None:
+    conf = Config({"a": ["x"], "sub": {"b": [{"c": 1}]}})
+
+    assert conf.get_str_list("x", fallback=["y"]) == ["y"]
+    assert conf.get_str_list("a", fallback=["y"]) == ["x"]
+    assert conf.get_config_list("x", fallback=[]) == []
+    assert [c.to_dict() for c in conf.get_config_list("sub", "b", fallback=[])] == [
+        {"c": 1}
+    ]
@@ -0,0 +1,45 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+dedupe module tests.
+"""
+
+from pathlib import Path
+
+from emtorch.arguments import Arguments, RepeatMode
+from emtorch.case.dedupe import Deduplicator
+from emtorch.case.instance import CaseInstance
+from emtorch.config import Config
+from emtorch.results import Results
+
+
+def _given_files(directory: Path, **contents: bytes) -> Arguments:
+    for name, data in contents.items():
+        (directory / name).write_bytes(data)
+    return Arguments(
+        data=[directory / name for name in contents],
+        output_prefix="",
+        config=Path(),
+        repeats=2,
+        repeat_mode=RepeatMode.ABAB,
+    )
+
+
+def test_same_contents_skipped(tmp_path: Path) -> None:
+    args = _given_files(tmp_path, a=b"1", b=b"2", c=b"1")
+    results = Results(Config({}))
+
+    cases = Deduplicator(results).wrap(CaseInstance.stream_from(args))
+
+    assert [Path(c.identifier.unique).name for c in cases] == [
+        "a[0]",
+        "b[0]",
+        "a[1]",
+        "b[1]",
+    ]
+    assert results.duplicates == {
+        str(tmp_path / "c[0]"): str(tmp_path / "a[0]"),
+        str(tmp_path / "c[1]"): str(tmp_path / "a[1]"),
+    }
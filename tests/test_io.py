@@ -0,0 +1,253 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+io module tests.
+"""
+
+import logging
+import os
+import socket
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+import pytest
+
+from emtorch.config import Config
+from emtorch.io import IOLoop, SelectorBackend
+from emtorch.io.net import NetworkAddress
+from emtorch.io.process import ProcessWatch
+from emtorch.io.sockets import UdpClientSocket
+from emtorch.io.streams import InputStream, StreamLogger, StreamWriter
+
+
+class _Reader(InputStream):
+    def __init__(self, name: str, stream: IO[bytes], size: int = 1024):
+        super().__init__(name, stream)
+        self.size = size
+        self.data = bytearray()
+        self.received = threading.Event()
+        self.thread = ""
+
+    def read(self) -> None:
+        self.thread = threading.current_thread().name
+        data = os.read(self.fileno(), self.size)
+        if not data:
+            self.mark_eof()
+        self.data += data
+        self.received.set()
+
+
+@pytest.fixture(name="io", params=["selector", "asyncio"])
+def _given_io(request: pytest.FixtureRequest) -> Iterator[IOLoop]:
+    io = IOLoop.from_config(Config({"io": {"backend": request.param}}))
+    io.start()
+    yield io
+    io.stop()
+
+
+def test_queued_element_sent(io: IOLoop) -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(5)
+        queue = io.make_queue(tuple[NetworkAddress, bytes | memoryview])
+        udp = UdpClientSocket("udp", queue)
+        io.register(udp)
+
+        queue.put((NetworkAddress(*server.getsockname()), b"data"))
+
+        assert server.recv(1024) == b"data"
+        io.close(udp, block=True)
+
+
+def test_registration_replaces_selectable_of_same_fd(io: IOLoop) -> None:
+    r, w = os.pipe()
+    with os.fdopen(r, "rb") as stream:
+        first, second = _Reader("first", stream), _Reader("second", stream)
+        io.register(first)
+        io.register(second)
+
+        os.write(w, b"data")
+        os.close(w)
+
+        assert second.received.wait(5)
+        io.close(stream, block=True)
+    assert not first.data
+
+
+def test_close_of_flooded_stream_bounded() -> None:
+    backend = SelectorBackend(close_timeout=0.2)
+    io = IOLoop(backend)
+    io.start()
+    r, w = os.pipe()
+    stream = os.fdopen(r, "rb")
+    reader = _Reader("flooded", stream, size=1)  # never drained
+    io.register(reader)
+
+    def flood() -> None:
+        try:
+            while True:
+                os.write(w, b"x" * 1024)
+        except OSError:  # closed by the loop
+            pass
+
+    flooding = threading.Thread(target=flood)
+    flooding.start()
+    assert reader.received.wait(5)
+    try:
+        t0 = time.monotonic()
+        io.close(stream, block=True)
+        assert time.monotonic() - t0 < 2
+        assert backend.stats.deferred_closes > 0
+    finally:
+        flooding.join()
+        os.close(w)
+        io.stop()
+
+
+def test_wake_up_during_drain_of_interrupt_pipe_not_lost() -> None:
+    # pylint: disable=protected-access
+    backend = SelectorBackend()
+    pipe = backend._interrupt_pipe
+    drain = pipe.read
+    woken = threading.Event()
+
+    def wake_then_drain() -> None:
+        if not woken.is_set():  # wake-up (as by another thread) racing with the drain
+            woken.set()
+            backend._wake_select()
+        drain()
+
+    pipe.read = wake_then_drain  # type: ignore[method-assign]
+    io = IOLoop(backend)
+    io.start()
+    r, w = os.pipe()
+    try:
+        with os.fdopen(r, "rb") as stream:
+            io.call_later(0, lambda: None)
+            time.sleep(0.1)
+            io.register(_Reader("reader", stream))
+            closing = threading.Thread(target=io.close, args=(stream, True))
+            closing.start()
+            closing.join(5)
+            assert not closing.is_alive()
+    finally:
+        os.close(w)
+        io.stop()
+
+
+def test_stream_logger_joins_lines_split_between_reads(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    r, w = os.pipe()
+    with os.fdopen(r, "rb") as stream:
+        reader = StreamLogger("sub", "STDOUT", stream, read_size=4)
+        os.write(w, b"first\nsecond line\r\n\nlast")
+        os.close(w)
+        with caplog.at_level(logging.INFO):
+            while not reader.at_eof():
+                reader.read()
+            reader.close()
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "STDOUT - b'first'",
+        "STDOUT - b'second line'",
+        "STDOUT - b''",
+        "STDOUT - b'last'",
+    ]
+
+
+def _given_drained_pipe() -> tuple[IO[bytes], threading.Thread, bytearray]:
+    r, w = os.pipe()
+    received = bytearray()
+
+    def drain() -> None:
+        with os.fdopen(r, "rb") as stream:
+            while data := stream.read(4096):
+                received.extend(data)
+
+    reader = threading.Thread(target=drain)
+    reader.start()
+    return os.fdopen(w, "wb"), reader, received
+
+
+def test_stream_writer_writes_payload_and_source_file(
+    io: IOLoop, tmp_path: Path
+) -> None:
+    payload = bytes(range(256)) * 4096  # larger than pipe buffer
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"tail" * 10000)
+    stream, reader, received = _given_drained_pipe()
+
+    io.register(StreamWriter("w", stream, memoryview(payload), source.open("rb"), 1000))
+    reader.join(5)
+
+    assert not reader.is_alive()
+    assert received == payload + b"tail" * 10000
+    io.close(stream, block=True)
+
+
+def test_timers_fired_in_order_unless_cancelled(io: IOLoop) -> None:
+    fired: list[str] = []
+    done = threading.Event()
+    io.call_later(0.1, lambda: fired.append("late"))
+    io.call_later(0.05, lambda: fired.append("early"))
+    io.call_later(0.01, lambda: fired.append("cancelled")).cancel()
+    io.call_later(0.15, done.set)
+
+    assert done.wait(5)
+    assert fired == ["early", "late"]
+
+
+def test_loop_statistics_reported(io: IOLoop) -> None:
+    r, w = os.pipe()
+    with os.fdopen(r, "rb") as stream:
+        reader = StreamLogger("logger", "STDOUT", stream)
+        io.register(reader)
+        os.write(w, b"line\n" * 100)
+        os.close(w)
+        io.close(stream, block=True)
+    info: dict[str, Any] = {}
+
+    io.report(info)
+
+    assert info["io"]["selectables"]["logger"]["bytes"] == 500
+    assert info["io"]["events"] >= info["io"]["selectables"]["logger"]["calls"] > 0
+
+
+def test_selectables_assigned_to_shards() -> None:
+    io = IOLoop.from_config(
+        Config({"io": {"shards": [{"name": "fast", "match": ["fast.*"]}]}})
+    )
+    io.start()
+    try:
+        pipes = [os.pipe() for _ in range(2)]
+        streams = [os.fdopen(r, "rb") for r, _ in pipes]
+        readers = [_Reader("fast.reader", streams[0]), _Reader("bulk", streams[1])]
+        for reader, (_, w) in zip(readers, pipes):
+            io.register(reader)
+            os.write(w, b"data")
+            assert reader.received.wait(5)
+            os.close(w)
+        for stream in streams:
+            io.close(stream, block=True)
+    finally:
+        io.stop()
+
+    assert [reader.thread for reader in readers] == ["io-fast", "io-reader"]
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd not supported")
+def test_process_exit_notified(io: IOLoop) -> None:
+    with subprocess.Popen(["sleep", "0.1"]) as process:
+        watch = ProcessWatch("sleep", process)
+        io.register(watch)
+
+        assert not watch.wait(0)
+        assert watch.wait(5)
+        assert process.returncode == 0
+        io.close(watch, block=True)
@@ -0,0 +1,72 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+journal module tests.
+"""
+
+from pathlib import Path
+
+from emtorch.case.instance import CaseData, CaseId, CaseInstance
+from emtorch.config import Config
+from emtorch.context import Context
+from emtorch.results.basic import BasicResult
+from emtorch.results.journal import Journal
+from emtorch.results.values import TypedValue
+
+
+def _given_context() -> tuple[Context, TypedValue[int]]:
+    context = Context(Config({}))
+    context.register_subtask("task", BasicResult)
+    value = TypedValue[int]()
+    context.register_value("value", value)
+    return context, value
+
+
+def _execute(context: Context, value: TypedValue[int], name: str) -> None:
+    case = CaseInstance(CaseId.from_id(name), CaseData(Path(name)))
+    with context.enter_case(case) as case_context:
+        context.results.subtasks["task"].collect(case.identifier, "failure")
+        value.collect(case.identifier, 7)
+        case_context.hold()
+    case_context.release()
+
+
+def test_finished_cases_restored_from_journal(tmp_path: Path) -> None:
+    path = tmp_path / "test.journal"
+    context, value = _given_context()
+    with Journal(path) as journal:
+        context.results.add_case_listener(journal.append)
+        _execute(context, value, "a")
+        _execute(context, value, "b")
+
+    restored, _ = _given_context()
+    for record in Journal.read(path):
+        restored.results.restore_case(record)
+
+    assert restored.results.to_dict()["cases"] == context.results.to_dict()["cases"]
+    assert restored.results.to_dict()["values"] == context.results.to_dict()["values"]
+
+
+def test_incomplete_record_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "test.journal"
+    path.write_text('{"id": "a"}\n{"id": ', encoding="utf-8")
+    with Journal(path) as journal:
+        journal.append({"id": "b"})
+
+    assert Journal.read(path) == [{"id": "a"}, {"id": "b"}]
+
+
+def test_case_not_finished_until_released() -> None:
+    context, _ = _given_context()
+    finished: list[str] = []
+    context.results.add_case_listener(lambda r: finished.append(r["id"]))
+    case = CaseInstance(CaseId.from_id("a"), CaseData(Path("a")))
+
+    with context.enter_case(case) as case_context:
+        case_context.hold()
+    assert not finished
+
+    case_context.release()
+    assert finished == ["a"]
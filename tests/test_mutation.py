@@ -0,0 +1,51 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+mutation module tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from emtorch.case.mutation import MutationEngine
+
+
+def _given_engine(tmp_path: Path, count: int, *strategies: str) -> MutationEngine:
+    seeds = []
+    for name, data in (("a.bin", b"\x00" * 16), ("b.bin", b"\xff" * 16)):
+        (tmp_path / name).write_bytes(data)
+        seeds.append(tmp_path / name)
+    return MutationEngine(seeds, count, strategies, [b"TOKEN"], seed=1)
+
+
+def test_mutants_generated_deterministically(tmp_path: Path) -> None:
+    engine = _given_engine(tmp_path, 3, "bitflip", "insert", "splice", "dictionary")
+
+    first = [(d.identifier, d.contents) for d in engine.generate()]
+    second = [(d.identifier, d.contents) for d in engine.generate()]
+
+    assert [i for i, _ in first] == [
+        f"{tmp_path / n}~{i}" for n in ("a.bin", "b.bin") for i in range(3)
+    ]
+    assert first == second
+    assert len({c for _, c in first}) == 6
+
+
+def test_file_written_only_when_path_needed(tmp_path: Path) -> None:
+    data = next(_given_engine(tmp_path, 1, "bitflip").generate())
+    data.retain()
+
+    assert data.contents != b"\x00" * 16
+    path = data.path
+    assert path.read_bytes() == data.contents
+
+    data.release()
+    assert not path.exists()
+
+
+def test_unknown_strategy_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        _given_engine(tmp_path, 1, "unknown")
@@ -0,0 +1,120 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+probe and delay modules tests.
+"""
+
+import logging
+import shutil
+import socket
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+from emtorch.config import Config
+from emtorch.context import Context
+from emtorch.delay import ConditionalDelay, delay_from_config
+from emtorch.io.net import NetworkAddress
+from emtorch.probe import LogProbe, PingProbe, Probe, UdpProbe
+
+
+class _Ready(Probe):  # pylint: disable=too-few-public-methods
+    def __init__(self, after: float):
+        self.after = after
+
+    def wait(self, timeout: float) -> bool:
+        time.sleep(min(self.after, timeout))
+        return self.after <= timeout
+
+
+@pytest.fixture(name="echo_port")
+def _given_udp_echo_server() -> Iterator[int]:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(0.1)
+        stop = threading.Event()
+
+        def echo() -> None:
+            while not stop.is_set():
+                try:
+                    data, address = server.recvfrom(1024)
+                except TimeoutError:
+                    continue
+                server.sendto(data, address)
+
+        thread = threading.Thread(target=echo)
+        thread.start()
+        yield server.getsockname()[1]
+        stop.set()
+        thread.join()
+
+
+def test_conditional_delay_finished_when_ready() -> None:
+    assert ConditionalDelay(5, _Ready(0.05), "case", "delay").wait() < 1
+    assert ConditionalDelay(0.1, _Ready(5), "case", "delay").wait() < 1
+
+
+def test_conditional_delay_created_from_probe_config() -> None:
+    context = Context(
+        Config(
+            {
+                "delays": {
+                    "fixed": 0.5,
+                    "probed": {
+                        "max": 2,
+                        "probe": {"type": "log", "subtask": "a", "pattern": "x"},
+                    },
+                }
+            }
+        )
+    )
+
+    fixed = delay_from_config("delays", "fixed", context=context)
+    probed = delay_from_config("delays", "probed", context=context)
+
+    assert not isinstance(fixed, ConditionalDelay) and fixed.value == 0.5
+    assert isinstance(probed, ConditionalDelay) and isinstance(probed.probe, LogProbe)
+
+
+def test_log_probe_matches_lines_of_subtask() -> None:
+    probe = LogProbe("READY", "console")
+    subtask_logger = logging.LoggerAdapter(
+        logging.getLogger("emtorch.test"), extra={"subtask": "console"}
+    )
+    other_logger = logging.LoggerAdapter(
+        logging.getLogger("emtorch.test"), extra={"subtask": "other"}
+    )
+    timer = threading.Timer(0.05, subtask_logger.warning, ["target READY"])
+    timer.start()
+    other_logger.warning("READY")
+
+    assert probe.wait(5)
+    timer.join()
+    other = threading.Timer(0.05, other_logger.warning, ["READY"])
+    other.start()
+    assert not probe.wait(0.2)
+    other.join()
+    handler = probe._handler  # pylint: disable=protected-access
+    assert handler not in logging.getLogger().handlers
+
+
+def test_udp_probe_waits_for_reply_of_target(echo_port: int) -> None:
+    t0 = time.monotonic()
+    assert UdpProbe(NetworkAddress("localhost", echo_port), b"ping", 0.1).wait(5)
+    assert time.monotonic() - t0 < 1
+
+
+def test_udp_probe_not_ready_without_reply() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as silent:
+        silent.bind(("127.0.0.1", 0))
+        target = NetworkAddress("127.0.0.1", silent.getsockname()[1])
+        assert not UdpProbe(target, b"ping", 0.05).wait(0.2)
+
+
+@pytest.mark.skipif(shutil.which("ping") is None, reason="ping not available")
+def test_ping_probe_reports_reachable_host() -> None:
+    assert PingProbe("127.0.0.1", 0.2).wait(5)
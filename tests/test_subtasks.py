@@ -0,0 +1,299 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+subtasks module tests.
+"""
+
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from emtorch.case.instance import CaseData, CaseId, CaseInstance
+from emtorch.config import Config
+from emtorch.context import CaseContext, Context
+from emtorch.io.process import ProcessGroup
+from emtorch.subtasks import SubTasks, subtask_from_config
+from emtorch.subtasks.ping import PingIsAliveStream
+from emtorch.subtasks.server import SubprocessServer
+from emtorch.subtasks.subprocess import Spawner, Subprocess
+from emtorch.subtasks.subtask import BasicSubTask, SubTask
+
+
+class _Sleep(BasicSubTask):
+    def __init__(self, name: str, duration: float, events: list[str]):
+        super().__init__(name, logging.getLogger(__name__))
+        self._duration = duration
+        self._events = events
+
+    def basic_start(self, context: CaseContext) -> bool:
+        self._events.append(f"start {self.name}")
+        return True
+
+    def finish(self) -> BasicSubTask.Result:
+        time.sleep(self._duration)
+        self._events.append(f"finish {self.name}")
+        return self.Result.SUCCESS
+
+
+def _given_context() -> tuple[Context, CaseContext]:
+    context = Context(Config({}))
+    case = CaseInstance(CaseId.from_id("a"), CaseData(Path("a")))
+    return context, context.enter_case(case)
+
+
+def test_tasks_without_dependencies_list_are_executed_in_order() -> None:
+    context, case_context = _given_context()
+    events: list[str] = []
+    tasks = SubTasks(context, "test")
+    tasks.register(_Sleep("a", 0.01, events))
+    tasks.register(_Sleep("b", 0, events))
+
+    tasks.execute_for(case_context)
+
+    assert events == ["start a", "finish a", "start b", "finish b"]
+    assert context.results.subtasks["b"].to_dict()["success"] == ["a"]
+
+
+def test_independent_tasks_are_executed_concurrently() -> None:
+    context, case_context = _given_context()
+    events: list[str] = []
+    tasks = SubTasks(context, "test")
+    tasks.register(_Sleep("a", 0.2, events), after=[])
+    tasks.register(_Sleep("b", 0.2, events), after=[])
+    tasks.register(_Sleep("c", 0, events), after=["a", "b"])
+
+    t0 = time.monotonic()
+    tasks.execute_for(case_context)
+    elapsed = time.monotonic() - t0
+
+    assert elapsed < 0.35
+    assert events[:2] == ["start a", "start b"]
+    assert events[-2:] == ["start c", "finish c"]
+
+
+def test_task_is_started_when_its_dependencies_are_done() -> None:
+    context, case_context = _given_context()
+    events: list[str] = []
+    tasks = SubTasks(context, "test")
+    tasks.register(_Sleep("slow", 0.2, events), after=[])
+    tasks.register(_Sleep("fast", 0, events), after=[])
+    tasks.register(_Sleep("next", 0, events), after=["fast"])
+
+    tasks.execute_for(case_context)
+
+    assert events.index("finish next") < events.index("finish slow")
+
+
+def test_unknown_dependency_is_rejected() -> None:
+    context, _ = _given_context()
+    tasks = SubTasks(context, "test")
+    tasks.register(_Sleep("a", 0, []))
+
+    with pytest.raises(ValueError):
+        tasks.register(_Sleep("b", 0, []), after=["c"])
+
+
+def test_partition_moves_host_only_tasks_out_of_dependencies() -> None:
+    context, case_context = _given_context()
+    events: list[str] = []
+    tasks = SubTasks(context, "test")
+    tasks.register(_Sleep("a", 0, events))
+    tasks.register(_Sleep("b", 0, events), host_only=True)
+    tasks.register(_Sleep("c", 0, events))
+
+    target, host = tasks.partition()
+    target.execute_for(case_context)
+    host.execute_for(case_context)
+
+    assert events == [
+        "start a",
+        "finish a",
+        "start c",
+        "finish c",
+        "start b",
+        "finish b",
+    ]
+
+
+_SERVER = """
+import json, os, sys
+for line in sys.stdin:
+    request = json.loads(line)
+    result = "success" if request["id"] != "fail" else "failure"
+    print(json.dumps({"id": request["id"], "result": result, "values": {"pid": os.getpid()}}))
+    sys.stdout.flush()
+"""
+
+
+def test_server_handles_cases_and_is_restarted() -> None:
+    context = Context(Config({}))
+    server = SubprocessServer.from_config(
+        "server",
+        Config(
+            {
+                "cmd": [sys.executable, "-c", _SERVER],
+                "timeout": 5,
+                "restart_after": 2,
+                "values": ["pid"],
+            }
+        ),
+        context,
+    )
+    results = context.register_subtask(server.name, server.result_type)
+    with context:
+        for case in ["a", "fail", "c"]:
+            instance = CaseInstance(CaseId.from_id(case), CaseData(Path(case)))
+            with context.enter_case(instance) as case_context:
+                assert server.start(case_context) is SubTask.STARTED
+                results.collect(case_context.case.identifier, server.finish())
+
+    assert results.to_dict()["success"] == ["a", "c"]
+    assert results.to_dict()["failure"] == ["fail"]
+    pids = [p["value"] for p in context.results.values["pid"].to_dict()["points"]]
+    assert pids[0] == pids[1] != pids[2]
+    assert server.process is None
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd not supported")
+def test_subprocess_resource_usage_stored_as_values() -> None:
+    context = Context(Config({}))
+    subtask = Subprocess.from_config(
+        "busy",
+        Config(
+            {
+                "cmd": [sys.executable, "-c", "sum(range(10**6))"],
+                "shell": False,
+                "finish": {"timeout": 5, "signal": "NONE"},
+            }
+        ),
+        context,
+    )
+    results = context.register_subtask(subtask.name, subtask.result_type)
+    with context:
+        instance = CaseInstance(CaseId.from_id("a"), CaseData(Path("a")))
+        with context.enter_case(instance) as case_context:
+            assert subtask.start(case_context) is SubTask.STARTED
+            results.collect(case_context.case.identifier, subtask.finish())
+
+    values = {
+        name: float(points[0]["value"])
+        for name, value in context.results.values.items()
+        if (points := value.to_dict()["points"])
+    }
+    assert results.to_dict()["success"] == ["a"]
+    assert set(values) == {
+        "busy.wall_time",
+        "busy.user_time",
+        "busy.system_time",
+        "busy.max_rss",
+        "busy.context_switches",
+        "busy.leaked_processes",
+    }
+    assert values["busy.wall_time"] >= values["busy.user_time"] > 0
+    assert values["busy.max_rss"] > 0
+    assert values["busy.leaked_processes"] == 0
+
+
+def test_processes_left_by_subprocess_are_stopped() -> None:
+    context = Context(Config({}))
+    subtask = Subprocess.from_config(
+        "leaking",
+        Config(
+            {
+                "cmd": ["trap '' TERM; sleep 30 & sleep 30 & echo started"],
+                "shell": True,
+                "finish": {"timeout": 5, "signal": "NONE", "grace": 0.2},
+            }
+        ),
+        context,
+    )
+    with context:
+        instance = CaseInstance(CaseId.from_id("a"), CaseData(Path("a")))
+        with context.enter_case(instance) as case_context:
+            assert subtask.start(case_context) is SubTask.STARTED
+            assert subtask.finish() is BasicSubTask.Result.SUCCESS
+
+    assert subtask.process is not None
+    assert not ProcessGroup(subtask.process.pid).members()
+    leaked = context.results.values["leaking.leaked_processes"].to_dict()["points"]
+    assert [p["value"] for p in leaked] == [2]
+
+
+def test_spawner_reports_spawn_latency() -> None:
+    spawner = Spawner.from_config(Config({}))
+    for args, shell in ((["true"], False), (["exit 3"], True)):
+        with spawner.spawn(args, shell) as process:
+            process.communicate()
+    info: dict[str, Any] = {}
+
+    spawner.report(info)
+
+    assert process.returncode == 3
+    assert info["spawn"]["processes"] == 2
+    assert info["spawn"]["max"] >= info["spawn"]["mean"] > 0
+
+
+def _icmp_permitted() -> bool:
+    try:
+        socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP).close()
+    except OSError:
+        return False
+    return True
+
+
+@pytest.mark.skipif(not _icmp_permitted(), reason="ICMP sockets not permitted")
+def test_native_ping_measures_round_trip_time() -> None:
+    context = Context(Config({}))
+    args = {"host": "127.0.0.1", "count": 3, "interval": 0.05, "native": True}
+    subtask = subtask_from_config(
+        Config({"type": "ping_stable", "name": "ping", "args": args}), context, "case"
+    )
+    results = context.register_subtask(subtask.name, subtask.result_type)
+    with context:
+        instance = CaseInstance(CaseId.from_id("a"), CaseData(Path("a")))
+        with context.enter_case(instance) as case_context:
+            assert subtask.start(case_context) is SubTask.STARTED
+            results.collect(case_context.case.identifier, subtask.finish())
+
+    assert results.to_dict()["success"] == ["a"]
+    rtt = context.results.values["case.ping.rtt"].to_dict()["points"]
+    assert 0 < float(rtt[0]["value"]) < 0.05
+
+
+def test_ping_output_parsed_in_chunks(caplog: pytest.LogCaptureFixture) -> None:
+    r, w = os.pipe()
+    with (
+        subprocess.Popen(["sleep", "10"]) as process,
+        os.fdopen(r, "rb") as stream,
+        caplog.at_level(logging.INFO),
+    ):
+        ping = PingIsAliveStream("ping", stream, process)
+        for chunk in (
+            b"PING host 56(84) bytes",
+            b" of data.\n...E.",
+            b"\x08.\x08.\x08",
+        ):
+            os.write(w, chunk)
+            ping.read()
+        os.close(w)
+        ping.read()
+
+        assert process.wait(timeout=5) != 0
+    assert ping.at_eof() and ping.response_received
+    assert [r.getMessage() for r in caplog.records] == [
+        "STDOUT - b'PING host 56(84) bytes of data.'",
+        "Ping x3",
+        "Error response",
+        "Ping",
+        "Response received",
+        "Ping received",
+    ]
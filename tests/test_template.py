@@ -0,0 +1,36 @@
+# Copyright (c) 2026 Warsaw University of Technology
+# This file is licensed under the MIT License.
+# See the LICENSE.txt file in the root of the repository for full details.
+
+"""
+template module tests.
+"""
+
+from emtorch.context.template import substitute_variables
+
+
+def test_substitutes_variables_in_nested_values() -> None:
+    config = {"a": "$HOST:${PORT}", "b": ["x $HOST", {"c": "${HOST}y"}], "d": 1}
+
+    result = substitute_variables(config, {"HOST": "h", "PORT": 80})
+
+    assert result == {"a": "h:80", "b": ["x h", {"c": "hy"}], "d": 1}
+
+
+def test_single_reference_keeps_value_type() -> None:
+    config = {"port": "$PORT", "braced": "${PORT}"}
+
+    result = substitute_variables(config, {"PORT": 5683})
+
+    assert result == {"port": 5683, "braced": 5683}
+
+
+def test_leaves_unknown_references_and_escapes() -> None:
+    config = {"cmd": "cat $EMTORCH_DATA_PATH $$HOST $HOST", "other": "$EMTORCH_CASE_ID"}
+
+    result = substitute_variables(config, {"HOST": "h"})
+
+    assert result == {
+        "cmd": "cat $EMTORCH_DATA_PATH $$HOST h",
+        "other": "$EMTORCH_CASE_ID",
+    }